@@ -41,10 +41,18 @@ def expand(val: str) -> Path:
 def collect_cache_files(apps_dir: Path) -> list[Path]:
     targets: list[Path] = []
 
-    # Global phase1 cache (and any leftover .tmp from interrupted write)
-    # Also sweep scripts/ in case the cache was written there by an earlier run
+    # Global phase1 cache, per-file hash cache and pipeline checkpoint (and any leftover
+    # .tmp from interrupted write). Also sweep scripts/ in case the cache was written
+    # there by an earlier run
     for search_dir in (SKILL_DIR, SKILL_DIR / "scripts"):
-        for name in (".phase1-cache.json", ".phase1-cache.tmp"):
+        for name in (
+            ".phase1-cache.json",
+            ".phase1-cache.tmp",
+            ".phase1-hashcache.json",
+            ".phase1-hashcache.tmp",
+            ".pipeline-checkpoint.json",
+            ".pipeline-checkpoint.tmp",
+        ):
             p = search_dir / name
             if p.exists() and p not in targets:
                 targets.append(p)
@@ -19,10 +19,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from render_report import render_html, render_markdown
+from render_report import render_html, render_markdown, resolve_insight_links
 
 
 HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*$")
+# Shared compact encoder for the consolidated report JSON.
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
 
 def normalize_heading(title: str) -> str:
@@ -434,18 +436,20 @@ def collect_report_paths(
 def write_outputs(report_obj: dict[str, Any], output_base: Path, formats: list[str]) -> list[Path]:
     written: list[Path] = []
     output_base.parent.mkdir(parents=True, exist_ok=True)
+    # Both renderers read linked insights; resolve them once. JSON keeps the links.
+    render_obj = resolve_insight_links(report_obj) if "md" in formats and "html" in formats else report_obj
 
     if "json" in formats:
         p = output_base.with_suffix(".json")
-        p.write_text(json.dumps(report_obj, separators=(",", ":")), encoding="utf-8")
+        p.write_text(_COMPACT_ENCODER.encode(report_obj), encoding="utf-8")
         written.append(p)
     if "md" in formats:
         p = output_base.with_suffix(".md")
-        p.write_text(render_markdown(report_obj), encoding="utf-8")
+        p.write_text(render_markdown(render_obj), encoding="utf-8")
         written.append(p)
     if "html" in formats:
         p = output_base.with_suffix(".html")
-        p.write_text(render_html(report_obj), encoding="utf-8")
+        p.write_text(render_html(render_obj), encoding="utf-8")
         written.append(p)
 
     return written
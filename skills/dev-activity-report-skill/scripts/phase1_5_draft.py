@@ -6,6 +6,7 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -26,6 +27,8 @@ try:
 except Exception:  # pragma: no cover
     append_usage = None  # type: ignore
 
+from run_pipeline import dumps_compact  # one compact-JSON contract for every prompt
+
 SKILL_DIR = Path(__file__).resolve().parent.parent
 
 
@@ -65,21 +68,31 @@ THOROUGH_PROMPT = (
 )
 
 
-def build_prompt(summary: Dict[str, Any], env: dict[str, str]) -> str:
-    thorough = env.get("PHASE15_THOROUGH", "false").strip().lower() in {"1", "true", "yes", "on"}
+# Same accepted values as run_pipeline's PHASE15_THOROUGH / USE_CODEX flags.
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+
+def _truthy(raw: str | None) -> bool:
+    return bool(raw) and raw.strip().lower() in _TRUTHY
+
+
+@lru_cache(maxsize=32)
+def _prompt_header(thorough: bool, extra_rules: str) -> str:
+    """Instruction block preceding the summary; constant for a given .env."""
     prompt = THOROUGH_PROMPT if thorough else TERSE_PROMPT
-    extra_rules = (env.get("PHASE15_RULES_EXTRA") or env.get("PHASE15_PROMPT_PREFIX") or "").strip()
     if extra_rules:
         prompt = (
             f"{prompt}\n\n"
             "Additional user rules from .env (must not alter required output format):\n"
             f"{extra_rules}"
         )
-    return (
-        f"{prompt}\n\n"
-        "Summary JSON (read-only context; do not rewrite it):\n"
-        f"{json.dumps(summary, separators=(',',':'))}"
-    )
+    return f"{prompt}\n\nSummary JSON (read-only context; do not rewrite it):\n"
+
+
+def build_prompt(summary: Dict[str, Any], env: dict[str, str]) -> str:
+    thorough = _truthy(env.get("PHASE15_THOROUGH"))
+    extra_rules = (env.get("PHASE15_RULES_EXTRA") or env.get("PHASE15_PROMPT_PREFIX") or "").strip()
+    return _prompt_header(thorough, extra_rules) + dumps_compact(summary)
 
 
 def call_model(prompt: str, env: dict[str, str], summary: Dict[str, Any]) -> tuple[str, dict[str, int]]:
@@ -87,7 +100,7 @@ def call_model(prompt: str, env: dict[str, str], summary: Dict[str, Any]) -> tup
     base = env.get("PHASE15_API_BASE") or env.get("OPENAI_API_BASE")
     api_key = env.get("PHASE15_API_KEY") or env.get("OPENAI_API_KEY")
     subscription_mode = env.get("SUBSCRIPTION_MODE", "false").lower() == "true"
-    thorough = env.get("PHASE15_THOROUGH", "false").strip().lower() in {"1", "true", "yes", "on"}
+    thorough = _truthy(env.get("PHASE15_THOROUGH"))
     system_msg = (
         "You are a sharp-eyed engineering analyst. Be opinionated and specific."
         if thorough else
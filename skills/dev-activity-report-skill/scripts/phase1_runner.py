@@ -5,16 +5,21 @@ from __future__ import annotations
 
 import argparse
 import fnmatch
+import functools
 import hashlib
 import json
+import multiprocessing
 import os
 import re
+import stat
 import subprocess
 import sys
-from collections import deque
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Sequence
 
 try:
     from dotenv import dotenv_values  # type: ignore
@@ -26,8 +31,14 @@ try:
 except ImportError:  # pragma: no cover
     pygit2 = None
 
+try:
+    import blake3  # type: ignore
+except ImportError:  # pragma: no cover
+    blake3 = None
+
 SKILL_DIR = Path(__file__).resolve().parent.parent
 CACHE_FILE = SKILL_DIR / ".phase1-cache.json"
+HASH_CACHE_FILE = SKILL_DIR / ".phase1-hashcache.json"
 INSIGHTS_LOG = SKILL_DIR / "references" / "examples" / "insights" / "insights-log.md"
 FP_IGNORE_FILE = SKILL_DIR / ".dev-report-fingerprint-ignore"
 
@@ -44,26 +55,31 @@ def load_fp_ignore_patterns() -> list[str]:
     return patterns
 
 
-def _matches_ignore(rel_path: str, patterns: list[str]) -> bool:
-    """Return True if rel_path matches any ignore glob pattern.
+@functools.lru_cache(maxsize=8)
+def _ignore_matcher(patterns: tuple[str, ...]) -> Callable[[str], bool]:
+    """Compile ignore globs into one predicate: True if a posix rel path is ignored.
 
     Supports:
     - Standard fnmatch against the full relative path
     - fnmatch against the filename alone
     - Directory prefix: pattern ending with '/*' is treated as a prefix match
       so 'todos/*' matches 'todos/uuid/1.json' at any depth.
+
+    All globs share a single alternation regex, so a path costs two regex
+    matches instead of two fnmatch calls per pattern.
     """
-    rel_posix = rel_path.replace(os.sep, "/")
-    name = Path(rel_path).name
-    for pat in patterns:
-        if fnmatch.fnmatch(rel_posix, pat) or fnmatch.fnmatch(name, pat):
+    if not patterns:
+        return lambda rel_posix: False
+    glob = re.compile("|".join(fnmatch.translate(pat) for pat in patterns)).match
+    dir_prefixes = tuple(pat[:-2] for pat in patterns if pat.endswith("/*"))
+    dir_children = tuple(prefix + "/" for prefix in dir_prefixes)
+
+    def matches(rel_posix: str) -> bool:
+        if glob(rel_posix) or glob(rel_posix.rpartition("/")[2]):
             return True
-        # Treat "dir/*" as a recursive prefix: anything under "dir/"
-        if pat.endswith("/*"):
-            prefix = pat[:-2]  # strip trailing /*
-            if rel_posix == prefix or rel_posix.startswith(prefix + "/"):
-                return True
-    return False
+        return rel_posix in dir_prefixes or rel_posix.startswith(dir_children)
+
+    return matches
 
 DEFAULTS: dict[str, str] = {
     "APPS_DIR": "~/projects",
@@ -84,13 +100,46 @@ DEFAULTS: dict[str, str] = {
 }
 
 MARKERS = [".not-my-work", ".skip-for-now", ".forked-work", ".forked-work-modified"]
-IGNORED_DIRS = {".git", "node_modules", "venv", "bin", "obj", ".cache", "__pycache__"}
+MARKER_STATUS = {
+    ".not-my-work": "not",
+    ".skip-for-now": "skip",
+    ".forked-work": "fork",
+    ".forked-work-modified": "fork_mod",
+}
+# When one project carries several markers (at any depth), the first listed status wins.
+STATUS_PRECEDENCE = ("fork_mod", "skip", "not", "fork")
+_MARKER_NAMES = frozenset(MARKERS)
+# Interned frozenset: DirEntry names compare equal by hash, and an identity hit
+# short-circuits the string compare for the common interned names.
+IGNORED_DIRS = frozenset(
+    sys.intern(name) for name in (".git", "node_modules", "venv", "bin", "obj", ".cache", "__pycache__")
+)
 MAX_INSIGHTS_LINES = 24
 MAX_CHANGED_FILES = 10
 MAX_COMMIT_MESSAGES = 6
 MAX_KEY_FILES = 6
 MAX_ACTIVE_CWDS = 20
 MAX_HASH_FILE_SIZE = 100 * 1024 * 1024  # 100 MB — skip content hash for files larger than this
+STREAM_CHUNK = 1024 * 1024  # files above this are hashed in chunks rather than one read
+PARALLEL_HASH_MIN_FILES = 16  # below this, thread-pool spin-up costs more than it saves
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+PARALLEL_PROJECTS_MIN = 4  # fewer projects than this are fingerprinted in-process
+_POOL_CONTEXT = multiprocessing.get_context()  # platform default start method
+PROJECT_WORKERS = min(8, os.cpu_count() or 1)
+HASH_MEMO_MAX = 50_000  # in-process hash_file results kept (LRU)
+
+# Content hash for files and rollups: BLAKE3 (SIMD) when installed, else hashlib's
+# OpenSSL SHA-256, which uses SHA-NI on CPUs that have it. Both give 64 hex chars.
+_HASH = blake3.blake3 if blake3 is not None else hashlib.sha256
+
+
+def hash_backend() -> str:
+    """Describe the active content-hash backend (reported by --hash-info)."""
+    if blake3 is not None:
+        return f"blake3 {getattr(blake3, '__version__', '')}".strip()
+    import ssl
+
+    return f"{hashlib.sha256().name} ({ssl.OPENSSL_VERSION})"
 
 
 def load_env() -> dict[str, str]:
@@ -157,35 +206,184 @@ def resolve_since(cli_since: str | None, env: dict[str, str]) -> str | None:
     return None
 
 
-def hash_file(path: Path) -> str:
-    h = hashlib.sha256()
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_NONBLOCK", 0)  # never block on a FIFO
+
+
+def _open_regular(path: str | Path) -> tuple[int, os.stat_result] | None:
+    """Open path and return (fd, stat), or None if it is not a regular file.
+
+    One open + fstat replaces the separate is_file()/stat()/open() lookups.
+    Raises OSError if the path cannot be opened.
+    """
+    fd = os.open(path, _OPEN_FLAGS)
+    st = os.fstat(fd)
+    if not stat.S_ISREG(st.st_mode):
+        os.close(fd)
+        return None
+    return fd, st
+
+
+_STREAM_BUF = threading.local()  # one reusable read buffer per hashing thread
+
+
+def _stream_digest(fd: int) -> str:
+    """Digest a file's full contents in STREAM_CHUNK reads into a per-thread buffer.
+
+    Gives the same digest as hash_bytes() over the whole file. Raises OSError
+    like a normal read would.
+    """
+    h = _HASH()
+    if not hasattr(os, "readv"):
+        while chunk := os.read(fd, STREAM_CHUNK):
+            h.update(chunk)
+        return h.hexdigest()
+    buf = getattr(_STREAM_BUF, "buf", None)
+    if buf is None:
+        buf = _STREAM_BUF.buf = bytearray(STREAM_CHUNK)
+    view = memoryview(buf)
+    while n := os.readv(fd, [buf]):
+        h.update(view[:n])
+    return h.hexdigest()
+
+
+def hash_bytes(buf: bytes | bytearray | memoryview) -> str:
+    """Content digest of an in-memory buffer.
+
+    Matches hash_file() for a file with the same bytes (below
+    MAX_HASH_FILE_SIZE), so callers that already hold contents (e.g. git blob
+    data) can skip the disk round-trip.
+    """
+    return _HASH(memoryview(buf).cast("B")).hexdigest()
+
+
+def _read_all(fd: int, size: int) -> bytes:
+    """Read a file to EOF via raw fd reads; one read suffices unless it grew."""
+    data = os.read(fd, size + 1)
+    if len(data) <= size:
+        return data
+    chunks = [data]
+    while chunk := os.read(fd, 1024 * 1024):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+# In-process LRU of hash_file results keyed by (abs path, mtime_ns, size); any
+# metadata change misses. Each OrderedDict call is atomic under the GIL, so the
+# hash_non_git_dir worker threads can share it without a lock.
+_HASH_MEMO: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+
+
+def hash_file(path: str | Path, st: os.stat_result | None = None) -> str:
+    """Content digest of path ("" if unreadable or not a regular file).
+
+    Callers that already hold a stat (e.g. from a DirEntry) pass it as st, which
+    lets memo hits skip the open entirely.
+    """
+    fd = None
     try:
-        if path.stat().st_size > MAX_HASH_FILE_SIZE:
-            return hashlib.sha256(b"LARGE_FILE:" + str(path).encode()).hexdigest()
-        with path.open("rb") as fh:
-            for chunk in iter(lambda: fh.read(1024 * 1024), b""):
-                h.update(chunk)
+        if st is None:
+            opened = _open_regular(path)
+            if opened is None:
+                return ""
+            fd, st = opened
+        elif not stat.S_ISREG(st.st_mode):
+            return ""
+        size = st.st_size
+        path_s = os.fspath(path)
+        key = (path_s if os.path.isabs(path_s) else os.path.abspath(path_s), st.st_mtime_ns, size)
+        digest = _HASH_MEMO.get(key)
+        if digest is not None:
+            try:
+                _HASH_MEMO.move_to_end(key)
+            except KeyError:  # evicted by another thread meanwhile
+                pass
+            return digest
+        if size > MAX_HASH_FILE_SIZE:
+            digest = hashlib.sha256(b"LARGE_FILE:" + path_s.encode()).hexdigest()
+        else:
+            if fd is None:
+                fd = os.open(path, _OPEN_FLAGS)
+            if size > STREAM_CHUNK:
+                digest = _stream_digest(fd)
+            else:
+                digest = hash_bytes(_read_all(fd, size))
     except OSError:
         return ""
+    finally:
+        if fd is not None:
+            os.close(fd)
+    _HASH_MEMO[key] = digest
+    if len(_HASH_MEMO) > HASH_MEMO_MAX:
+        try:
+            _HASH_MEMO.popitem(last=False)
+        except KeyError:
+            pass
+    return digest
+
+
+def _rollup(rels: Iterable[str], digests: Iterable[str | None]) -> str:
+    """Hash (length-prefixed rel path, file digest) records in order; None digests are skipped.
+
+    The 2-byte length prefix keeps path/digest boundaries unambiguous. Both
+    arguments may be lazy iterators; each record is hashed as it arrives.
+    """
+    h = _HASH()
+    for rel, digest in zip(rels, digests):
+        if digest is None:
+            continue
+        rel_b = rel.encode()
+        h.update(len(rel_b).to_bytes(2, "little") + rel_b + digest.encode())
     return h.hexdigest()
 
 
 def hash_paths(base: Path, files: Sequence[str]) -> str:
-    h = hashlib.sha256()
-    for rel in sorted(files):
-        h.update(rel.encode())
-        full = base / rel
-        if full.is_file():
-            try:
-                if full.stat().st_size > MAX_HASH_FILE_SIZE:
-                    h.update(b"LARGE_FILE")
-                    continue
-                with full.open("rb") as fh:
-                    for chunk in iter(lambda: fh.read(1024 * 1024), b""):
-                        h.update(chunk)
-            except OSError:
-                continue
-    return h.hexdigest()
+    # Unreadable or missing paths still contribute their name (empty digest).
+    rels = sorted(files)
+    return _rollup(rels, (hash_file(os.path.join(base, rel)) for rel in rels))
+
+
+# Per-file meta cache: abs path -> [mtime_ns, size, hash]. Loaded from and saved to
+# HASH_CACHE_FILE by main(); entries are reused only while (mtime_ns, size) match.
+_HASH_META: dict[str, list] = {}
+_HASH_META_SEEN: set[str] = set()
+
+
+def cached_file_hash(path: str, st: os.stat_result) -> str:
+    """Return hash_file(path), reusing the meta-cache entry when mtime and size match."""
+    _HASH_META_SEEN.add(path)
+    entry = _HASH_META.get(path)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+    digest = hash_file(path, st)
+    if digest:
+        _HASH_META[path] = [st.st_mtime_ns, st.st_size, digest]
+    return digest
+
+
+def read_hash_cache() -> None:
+    _HASH_META.clear()
+    _HASH_META_SEEN.clear()
+    try:
+        data = json.loads(HASH_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return
+    # Digests depend on the active backend; drop entries written by another one.
+    if isinstance(data, dict) and data.get("backend") == hash_backend():
+        _HASH_META.update(data.get("files", {}))
+
+
+def write_hash_cache() -> None:
+    """Persist entries seen this run (files that disappeared are dropped)."""
+    files = {k: v for k, v in _HASH_META.items() if k in _HASH_META_SEEN}
+    tmp = HASH_CACHE_FILE.with_suffix(".tmp")
+    try:
+        tmp.write_text(json.dumps({"backend": hash_backend(), "files": files}, separators=(",", ":")))
+        tmp.replace(HASH_CACHE_FILE)  # atomic on POSIX
+    except OSError:
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
 
 
 def git_tracked_files(path: Path) -> list[str]:
@@ -283,31 +481,71 @@ def hash_git_repo(path: Path) -> str:
     files = git_tracked_files(path)
     ignore = load_fp_ignore_patterns()
     if ignore:
-        files = [f for f in files if not _matches_ignore(f, ignore)]
+        ignored = _ignore_matcher(tuple(ignore))
+        files = [f for f in files if not ignored(f.replace(os.sep, "/"))]
     return hash_paths(path, files)
 
 
+def _walk(root: str, rel: str, depth: int, max_depth: int) -> Iterable[tuple[str, os.DirEntry]]:
+    """Yield (rel_path, entry) for files under root via os.scandir.
+
+    IGNORED_DIRS, dot-dirs and symlinked dirs are pruned without being opened;
+    directories deeper than max_depth are not listed.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                yield rel + name, entry
+            elif (
+                depth < max_depth
+                and name not in IGNORED_DIRS
+                and not name.startswith(".")
+                and not entry.is_symlink()
+            ):
+                yield from _walk(entry.path, rel + name + os.sep, depth + 1, max_depth)
+
+
 def hash_non_git_dir(path: Path, allowed_exts: set[str], max_depth: int = 4) -> str:
-    selected: list[str] = []
-    ignore = load_fp_ignore_patterns()
-    if not path.exists():
+    selected: list[tuple[str, os.DirEntry]] = []
+    ignored = _ignore_matcher(tuple(load_fp_ignore_patterns()))
+    root = os.fspath(path)  # str from here on; Path only at the API boundary
+    if not os.path.exists(root):
         return ""
-    for root, dirs, files in os.walk(path):
-        rel_root = os.path.relpath(root, path)
-        depth = 0 if rel_root == "." else rel_root.count(os.sep) + 1
-        if depth > max_depth:
-            dirs[:] = []
+    suffixes = tuple({ext.lower() for ext in allowed_exts})
+    to_posix = os.sep != "/"
+    for rel_path, entry in _walk(root, "", 0, max_depth):
+        if not entry.name.lower().endswith(suffixes):
             continue
-        dirs[:] = [d for d in dirs if d not in IGNORED_DIRS and not d.startswith(".")]
-        for name in files:
-            suffix = Path(name).suffix.lower()
-            if suffix not in allowed_exts:
-                continue
-            rel_path = os.path.relpath(Path(root) / name, path)
-            if ignore and _matches_ignore(rel_path, ignore):
-                continue
-            selected.append(rel_path)
-    return hash_paths(path, selected)
+        if ignored(rel_path.replace(os.sep, "/") if to_posix else rel_path):
+            continue
+        selected.append((rel_path, entry))
+    selected.sort(key=lambda item: item[0])
+    # Digests stream straight into the rollup in path order; no digest list is built.
+    rels = (rel for rel, _ in selected)
+    entries = (entry for _, entry in selected)
+    if HASH_WORKERS > 1 and len(selected) >= PARALLEL_HASH_MIN_FILES:
+        # hashlib releases the GIL while digesting, so reads and hashing overlap.
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+            return _rollup(rels, pool.map(_file_digest, entries))
+    return _rollup(rels, map(_file_digest, entries))
+
+
+def _file_digest(entry: os.DirEntry) -> str | None:
+    # DirEntry.stat() caches its result, so the walk's stat is the only one.
+    try:
+        st = entry.stat()
+    except OSError:
+        return None
+    return cached_file_hash(entry.path, st)
 
 
 def safe_stat(path: Path) -> int | None:
@@ -317,42 +555,71 @@ def safe_stat(path: Path) -> int | None:
         return None
 
 
+def _list_dir(path: str) -> tuple[set[str], list[str]]:
+    """Return (non-directory names, sorted non-symlink subdirectory paths) for path."""
+    names: set[str] = set()
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir() and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    elif not entry.is_dir():
+                        names.add(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    subdirs.sort()
+    return names, subdirs
+
+
+def _dir_names(path: str) -> set[str]:
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
 def discover_markers(apps_dir: Path) -> tuple[list[dict[str, str]], dict[str, str]]:
     markers = []
     project_status: dict[str, str] = {}
     if not apps_dir.exists():
         return markers, project_status
-    for root, dirs, files in os.walk(apps_dir):
-        rel = os.path.relpath(root, apps_dir)
-        depth = 0 if rel == "." else rel.count(os.sep) + 1
-        if depth > 2:
-            dirs[:] = []
-            continue
-        for marker in MARKERS:
-            if marker in files:
-                rel_path = Path(root).relative_to(apps_dir)
-                project = rel_path.parts[0] if rel_path.parts else ""
-                markers.append(
-                    {
-                        "m": marker,
-                        "p": project,
-                        "path": str(Path(root).resolve()),
-                        "r": str(apps_dir.resolve()),
-                    }
-                )
-                if marker == ".not-my-work":
-                    project_status[project] = "not"
-                elif marker == ".skip-for-now":
-                    project_status[project] = "skip"
-                elif marker == ".forked-work":
-                    project_status.setdefault(project, "fork")
-                elif marker == ".forked-work-modified":
-                    project_status[project] = "fork_mod"
+    root = str(apps_dir.resolve())
+    found_status: dict[str, set[str]] = {}
+    # Bounded BFS: apps_dir (depth 0), projects (1) and their children (2) are each
+    # listed once and intersected with the marker names; nothing deeper is opened.
+    level: list[tuple[str, str]] = [(os.fspath(apps_dir), "")]
+    for depth in range(3):
+        next_level: list[tuple[str, str]] = []
+        for dir_path, project in level:
+            if depth < 2:
+                names, subdirs = _list_dir(dir_path)
+                next_level.extend((sub, project or os.path.basename(sub)) for sub in subdirs)
+            else:
+                names = _dir_names(dir_path)
+            hits = names & _MARKER_NAMES
+            if not hits:
+                continue
+            resolved = str(Path(dir_path).resolve())
+            for marker in MARKERS:
+                if marker in hits:
+                    markers.append({"m": marker, "p": project, "path": resolved, "r": root})
+                    found_status.setdefault(project, set()).add(MARKER_STATUS[marker])
+        level = next_level
+    for project, statuses in found_status.items():
+        project_status[project] = next(s for s in STATUS_PRECEDENCE if s in statuses)
     return markers, project_status
 
 
+_CACHED_FP = re.compile(r"fingerprint:\s*([a-f0-9]+)")
+
+
 def parse_cached_fp(cache_header: str) -> str:
-    match = re.search(r"fingerprint:\s*([a-f0-9]+)", cache_header)
+    match = _CACHED_FP.search(cache_header)
     return match.group(1) if match else ""
 
 
@@ -367,6 +634,38 @@ def read_cache_header(project_path: Path) -> str:
         return ""
 
 
+def _fingerprint_one(task: tuple[str, bool, set[str]]) -> tuple[str, str, str]:
+    """Return (path, fingerprint, head) for one project."""
+    path_s, git_repo, allowed_exts = task
+    path = Path(path_s)
+    fingerprint = hash_git_repo(path) if git_repo else hash_non_git_dir(path, allowed_exts)
+    head = git_head(path) if git_repo else ""
+    return path_s, fingerprint, head
+
+
+def _init_project_worker(meta: dict[str, list]) -> None:
+    """Pool initializer. `meta` is the parent's loaded meta-cache: a spawned
+    worker (macOS/Windows default) re-imports this module with an empty one."""
+    # Projects already run in parallel; don't nest a thread pool per project.
+    global HASH_WORKERS
+    HASH_WORKERS = 1
+    if meta is not _HASH_META:  # a forked worker already inherited it
+        _HASH_META.update(meta)
+    _HASH_META_SEEN.clear()
+
+
+def _fingerprint_in_worker(task: tuple[str, bool, set[str]]) -> tuple[str, str, str, dict[str, list]]:
+    """_fingerprint_one in a pool worker, plus the meta-cache entries it used.
+
+    Worker processes hold their own copy of _HASH_META, so the entries are
+    shipped back for the parent to merge and persist.
+    """
+    path_s, fingerprint, head = _fingerprint_one(task)
+    meta = {k: _HASH_META[k] for k in _HASH_META_SEEN if k in _HASH_META}
+    _HASH_META_SEEN.clear()
+    return path_s, fingerprint, head, meta
+
+
 def collect_projects(apps_dir: Path, status_map: dict[str, str], allowed_exts: set[str]) -> list[dict[str, object]]:
     projects: list[dict[str, object]] = []
     if not apps_dir.exists():
@@ -375,15 +674,33 @@ def collect_projects(apps_dir: Path, status_map: dict[str, str], allowed_exts: s
     # Efficiently find git repos in top-level subfolders before pygit2/subprocess checks
     git_repo_paths = set(find_git_repos(apps_dir))
 
+    active: list[tuple[Path, str, bool]] = []
     for child in sorted(apps_dir.iterdir()):
         if not child.is_dir():
             continue
         project_status = status_map.get(child.name, "orig")
         if project_status in {"not", "skip"}:
             continue
-        git_repo = child in git_repo_paths
-        fingerprint = hash_git_repo(child) if git_repo else hash_non_git_dir(child, allowed_exts)
-        head = git_head(child) if git_repo else ""
+        active.append((child, project_status, child in git_repo_paths))
+
+    tasks = [(str(child), git_repo, allowed_exts) for child, _, git_repo in active]
+    results: dict[str, tuple[str, str]] = {}
+    if PROJECT_WORKERS > 1 and len(tasks) >= PARALLEL_PROJECTS_MIN:
+        with _POOL_CONTEXT.Pool(
+            processes=PROJECT_WORKERS, initializer=_init_project_worker, initargs=(_HASH_META,)
+        ) as pool:
+            for path_s, fingerprint, head, meta in pool.imap_unordered(_fingerprint_in_worker, tasks, chunksize=4):
+                results[path_s] = (fingerprint, head)
+                _HASH_META.update(meta)
+                _HASH_META_SEEN.update(meta)
+    else:
+        for task in tasks:
+            path_s, fingerprint, head = _fingerprint_one(task)
+            results[path_s] = (fingerprint, head)
+
+    root = str(apps_dir.resolve())
+    for child, project_status, git_repo in active:
+        fingerprint, head = results[str(child)]
         cache_header = read_cache_header(child)
         cached_fp = parse_cached_fp(cache_header)
         cache_hit = bool(fingerprint and cached_fp and fingerprint == cached_fp)
@@ -397,7 +714,7 @@ def collect_projects(apps_dir: Path, status_map: dict[str, str], allowed_exts: s
                 "cache_hit": cache_hit,
                 "status": project_status,
                 "git": git_repo,
-                "root": str(apps_dir.resolve()),
+                "root": root,
             }
         )
     return projects
@@ -529,7 +846,7 @@ def collect_key_files(path: Path, patterns: Iterable[str] = ("*.md", "*.csproj",
                 break
             for pat in patterns:
                 if fnmatch.fnmatch(name, pat):
-                    rel_path = os.path.relpath(Path(root) / name, path)
+                    rel_path = os.path.relpath(os.path.join(root, name), path)
                     matches.append(rel_path)
                     break
         if len(matches) >= MAX_KEY_FILES:
@@ -804,12 +1121,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--since", help="Limit git activity to commits since this date/time.")
     parser.add_argument("--refresh", action="store_true", help="Bypass global phase1 cache and rebuild payload.")
     parser.add_argument("--root", action="append", default=[], help="Project root directory to scan (repeatable).")
+    parser.add_argument("--hash-info", action="store_true", help="Print the content-hash backend and exit.")
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
+    if args.hash_info:
+        print(hash_backend())
+        return
     env = load_env()
+    read_hash_cache()
     allowed_exts = parse_exts(env.get("ALLOWED_FILE_EXTS", DEFAULTS["ALLOWED_FILE_EXTS"]))
 
     apps_roots = resolve_scan_roots(args.root, env)
@@ -829,6 +1151,7 @@ def main() -> None:
     claude_payload, claude_meta = collect_claude_activity(claude_home, allowed_exts)
     codex_payload, codex_meta = collect_codex_activity(codex_home, allowed_exts)
     insights_lines, insights_fp, insights_meta = collect_insights_log(env)
+    write_hash_cache()
 
     fingerprint_source = compute_fingerprint_source(
         apps_roots,
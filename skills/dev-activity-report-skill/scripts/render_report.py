@@ -7,11 +7,17 @@ import argparse
 import html
 import json
 import re
+import sys
 import urllib.parse
 from datetime import datetime
 from pathlib import Path
 from typing import Iterable
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 HTML_CSS = """
 <style>
   /* ── Reset & base ─────────────────────────────────────────────────────── */
@@ -158,6 +164,31 @@ HTML_CSS = """
 </style>
 """.strip()
 
+# Recommendation priority badges; other priorities render without one.
+_PRIORITY_MD = {"high": " `HIGH`", "medium": " `MEDIUM`"}
+_PRIORITY_HTML = {
+    "high": '<span class="priority-high">high</span>',
+    "medium": '<span class="priority-medium">medium</span>',
+}
+
+
+def _priority_badge(table: dict[str, str], priority) -> str:
+    # Model output is untrusted: a list or dict priority is unhashable.
+    return table.get(priority, "") if isinstance(priority, str) else ""
+
+
+# Tech inventory rows, in display order: (row label, tech_inventory key).
+_TECH_CATEGORIES = (
+    ("Languages", "languages"),
+    ("Frameworks / Libs", "frameworks"),
+    ("AI Tools", "ai_tools"),
+    ("Infra / Tooling", "infra"),
+)
+
+# Placeholders for sections with nothing to show.
+_EMPTY_MD = "- (none)"
+_EMPTY_HTML = "<p>(none)</p>"
+
 
 def _ensure_list(value) -> list:
     if value is None:
@@ -167,12 +198,18 @@ def _ensure_list(value) -> list:
     return [value]
 
 
+def _esc(value) -> str:
+    # Element-body escaping only: quotes are literal outside attribute values.
+    return html.escape(f"{value}", quote=False)
+
+
 def _get_section(report: dict, name: str) -> dict:
     return report.get("sections", {}).get(name, {}) or {}
 
 
 def _md_bullets(lines: Iterable[str], indent: str = "") -> str:
-    return "\n".join(f"{indent}- {line}" for line in lines)
+    # Null entries are dropped; f-string formatting stringifies everything else.
+    return "\n".join([f"{indent}- {line}" for line in lines if line is not None])
 
 
 def _extract_md_section_by_slug(path: Path, slug: str) -> list[str]:
@@ -215,14 +252,39 @@ def _read_lines_from_file_url(link: str) -> list[str]:
     except OSError:
         return []
     if file_path.suffix.lower() in {".html", ".htm"}:
-        raw = re.sub(r"(?is)<(script|style)[^>]*>.*?</\\1>", " ", raw)
-        raw = re.sub(r"(?i)<br\\s*/?>", "\n", raw)
+        raw = re.sub(r"(?is)<(script|style)[^>]*>.*?</\1>", " ", raw)
+        raw = re.sub(r"(?i)<br\s*/?>", "\n", raw)
         raw = re.sub(r"(?i)</(p|li|h1|h2|h3|h4|h5|h6|div|section|article)>", "\n", raw)
         raw = re.sub(r"(?s)<[^>]+>", " ", raw)
         raw = html.unescape(raw)
     return [line.strip() for line in raw.splitlines() if line.strip()]
 
 
+def resolve_insight_links(report: dict) -> dict:
+    """Return `report` with linked insights sections' content read in.
+
+    Sections that carry only a `file://` link are read here once, so
+    rendering both Markdown and HTML doesn't read (and tag-strip) the same
+    file twice. The input is not mutated; it is returned as-is when no
+    section needs reading.
+    """
+    insights = report.get("insights", {}) or {}
+    sections = insights.get("sections", []) or []
+    resolved = []
+    changed = False
+    for section in sections:
+        if isinstance(section, dict):
+            content = section.get("content") or []
+            link = section.get("link") or section.get("report_link") or ""
+            if not (isinstance(content, list) and content) and link:
+                section = {**section, "content": _read_lines_from_file_url(link)}
+                changed = True
+        resolved.append(section)
+    if not changed:
+        return report
+    return {**report, "insights": {**insights, "sections": resolved}}
+
+
 def _render_insights_markdown(report: dict) -> str:
     insights = report.get("insights", {}) or {}
     sections = insights.get("sections", []) or []
@@ -251,7 +313,7 @@ def _render_insights_markdown(report: dict) -> str:
                 quote_lines.append(f'"{quote}" ({link})')
             else:
                 quote_lines.append(f'"{quote}"')
-        block.append(_md_bullets(quote_lines) if quote_lines else "- (none)")
+        block.append(_md_bullets(quote_lines) if quote_lines else _EMPTY_MD)
         block.append("")
 
     if sections:
@@ -273,7 +335,7 @@ def _render_insights_markdown(report: dict) -> str:
             if content:
                 block.append(_md_bullets([str(line).strip() for line in content if str(line).strip()]))
             else:
-                block.append("- (none)")
+                block.append(_EMPTY_MD)
             block.append("")
 
     return "\n".join(line for line in block if line is not None).rstrip()
@@ -332,177 +394,136 @@ def _render_insights_html(report: dict) -> str:
                 lis = "".join(f"<li>{html.escape(str(line))}</li>" for line in content if str(line).strip())
                 parts.append(f"<ul>{lis}</ul>")
             else:
-                parts.append("<p>(none)</p>")
+                parts.append(_EMPTY_HTML)
 
     return "\n".join(parts)
 
 
+def _bullets(items: Iterable) -> str:
+    return "\n".join([f"- {item}" for item in items if item is not None]) or _EMPTY_MD
+
+
 def render_markdown(report: dict) -> str:
     generated_at = report.get("generated_at", "")
     resume_header = report.get("resume_header", "")
-    sections: list[str] = []
 
     # ── Title block ──────────────────────────────────────────────────────────
-    title_lines = ["# Dev Activity Report"]
+    title_md = "# Dev Activity Report"
     if resume_header:
-        title_lines.append(f"**{resume_header}**")
+        title_md += f"\n**{resume_header}**"
     if generated_at:
-        title_lines.append(f"*Generated: {generated_at}*")
-    sections.append("\n".join(title_lines))
+        title_md += f"\n*Generated: {generated_at}*"
 
     # ── Overview ─────────────────────────────────────────────────────────────
-    overview = _get_section(report, "overview").get("bullets", [])
-    block = ["## Overview", ""]
-    block.append(_md_bullets(overview) if overview else "- (none)")
-    sections.append("\n".join(block))
+    overview_md = _bullets(_ensure_list(_get_section(report, "overview").get("bullets")))
 
     # ── Key Changes ──────────────────────────────────────────────────────────
     key_changes = _get_section(report, "key_changes") or []
-    block = ["## Key Changes", ""]
     if key_changes:
         parts = []
         for item in key_changes:
             title = item.get("title") or "(untitled)"
-            sub = _ensure_list(item.get("bullets"))
-            parts.append(f"### {title}")
-            if sub:
-                parts.append(_md_bullets(sub))
-        block.append("\n\n".join(parts))
+            sub = _md_bullets(_ensure_list(item.get("bullets")))
+            parts.append(f"### {title}\n\n{sub}" if sub else f"### {title}")
+        key_changes_md = "\n\n".join(parts)
     else:
-        block.append("- (none)")
-    sections.append("\n".join(block))
+        key_changes_md = _EMPTY_MD
 
     # ── Recommendations ───────────────────────────────────────────────────────
     recs = _get_section(report, "recommendations") or []
-    block = ["## Recommendations", ""]
-    if recs:
-        lines = []
-        for rec in recs:
-            text = rec.get("text", "").rstrip()
-            priority = rec.get("priority", "")
-            marker = f" `{priority.upper()}`" if priority in ("high", "medium") else ""
-            lines.append(f"- {text}{marker}")
-        block.append("\n".join(lines))
-    else:
-        block.append("- (none)")
-    sections.append("\n".join(block))
+    recs_md = _bullets([
+        f"{rec.get('text', '').rstrip()}{_priority_badge(_PRIORITY_MD, rec.get('priority'))}" for rec in recs
+    ])
 
     # ── Resume Bullets ────────────────────────────────────────────────────────
     resume = _get_section(report, "resume_bullets") or []
-    block = ["## Resume Bullets", ""]
-    if resume:
-        block.append(_md_bullets(rb.get("text", "").rstrip() for rb in resume))
-    else:
-        block.append("- (none)")
-    sections.append("\n".join(block))
+    resume_md = _bullets([rb.get("text", "").rstrip() for rb in resume])
 
     # ── LinkedIn ──────────────────────────────────────────────────────────────
     linkedin = _get_section(report, "linkedin").get("sentences", [])
-    block = ["## LinkedIn", ""]
     if linkedin:
-        text = " ".join(s.strip() for s in linkedin if s)
-        block.append(f"> {text}")
+        linkedin_md = "> " + " ".join(s.strip() for s in linkedin if s)
     else:
-        block.append("(none)")
-    sections.append("\n".join(block))
+        linkedin_md = "(none)"
 
     # ── Highlights ────────────────────────────────────────────────────────────
     highlights = _get_section(report, "highlights") or []
-    block = ["## Highlights", ""]
-    if highlights:
-        lines = []
-        for h in highlights:
-            t = h.get("title", "").rstrip()
-            r = h.get("rationale", "").rstrip()
-            lines.append(f"- **{t}** — {r}" if r else f"- **{t}**")
-        block.append("\n".join(lines))
-    else:
-        block.append("- (none)")
-    sections.append("\n".join(block))
+    lines = []
+    for h in highlights:
+        t = h.get("title", "").rstrip()
+        r = h.get("rationale", "").rstrip()
+        lines.append(f"**{t}** — {r}" if r else f"**{t}**")
+    highlights_md = _bullets(lines)
 
     insights_md = _render_insights_markdown(report)
     if insights_md:
-        sections.append(insights_md)
+        insights_md = f"\n\n---\n\n{insights_md}"
 
     # ── Timeline ──────────────────────────────────────────────────────────────
     timeline = _get_section(report, "timeline") or []
-    block = ["## Timeline", ""]
     if timeline:
-        rows = ["| Date | Event |", "|:---|:---|"]
+        timeline_md = "| Date | Event |\n|:---|:---|"
         for row in timeline:
-            rows.append(f"| {row.get('date', '')} | {row.get('event', '')} |")
-        block.append("\n".join(rows))
+            timeline_md += f"\n| {row.get('date', '')} | {row.get('event', '')} |"
     else:
-        block.append("- (none)")
-    sections.append("\n".join(block))
+        timeline_md = _EMPTY_MD
 
     # ── Tech Inventory ────────────────────────────────────────────────────────
     tech = _get_section(report, "tech_inventory") or {}
-    block = ["## Tech Inventory", ""]
     if tech:
-        rows = ["| Category | Items |", "|:---|:---|"]
-        for label, key in (
-            ("Languages", "languages"),
-            ("Frameworks / Libs", "frameworks"),
-            ("AI Tools", "ai_tools"),
-            ("Infra / Tooling", "infra"),
-        ):
-            items = ", ".join(_ensure_list(tech.get(key)))
+        tech_md = "| Category | Items |\n|:---|:---|"
+        for label, key in _TECH_CATEGORIES:
+            items = ", ".join([str(x) for x in _ensure_list(tech.get(key)) if x is not None])
             if items:
-                rows.append(f"| {label} | {items} |")
-        block.append("\n".join(rows))
+                tech_md += f"\n| {label} | {items} |"
     else:
-        block.append("- (none)")
-    sections.append("\n".join(block))
+        tech_md = _EMPTY_MD
 
-    return "\n\n---\n\n".join(sections) + "\n"
+    return (
+        f"{title_md}\n\n---\n\n"
+        f"## Overview\n\n{overview_md}\n\n---\n\n"
+        f"## Key Changes\n\n{key_changes_md}\n\n---\n\n"
+        f"## Recommendations\n\n{recs_md}\n\n---\n\n"
+        f"## Resume Bullets\n\n{resume_md}\n\n---\n\n"
+        f"## LinkedIn\n\n{linkedin_md}\n\n---\n\n"
+        f"## Highlights\n\n{highlights_md}{insights_md}\n\n---\n\n"
+        f"## Timeline\n\n{timeline_md}\n\n---\n\n"
+        f"## Tech Inventory\n\n{tech_md}\n"
+    )
 
 
 def render_html(report: dict) -> str:
-    generated_at = report.get("generated_at") or datetime.utcnow().isoformat() + "Z"
-    resume_header = report.get("resume_header", "Dev Activity Report")
+    generated_at = _esc(report.get("generated_at") or datetime.utcnow().isoformat() + "Z")
+    resume_header = _esc(report.get("resume_header", "Dev Activity Report"))
 
     def ul(items: Iterable[str]) -> str:
-        lst = list(items)
-        if not lst:
-            return "<p>(none)</p>"
-        lis = "".join(f"<li>{item}</li>" for item in lst)
-        return f"<ul>{lis}</ul>"
-
-    def article(title: str, body: str) -> str:
-        return f'<article>\n<h2>{title}</h2>\n{body}\n</article>'
+        lis = "".join([f"<li>{_esc(item)}</li>" for item in items if item is not None])
+        return f"<ul>{lis}</ul>" if lis else _EMPTY_HTML
 
     # Overview
-    overview_html = ul(_get_section(report, "overview").get("bullets", []))
+    overview_html = ul(_ensure_list(_get_section(report, "overview").get("bullets")))
 
     # Key Changes
     key_changes = _get_section(report, "key_changes") or []
     if key_changes:
         parts = []
         for item in key_changes:
-            t = item.get("title") or "(untitled)"
+            t = _esc(item.get("title") or "(untitled)")
             sub = _ensure_list(item.get("bullets"))
             parts.append(f"<h3>{t}</h3>{ul(sub)}")
         key_changes_html = "\n".join(parts)
     else:
-        key_changes_html = "<p>(none)</p>"
+        key_changes_html = _EMPTY_HTML
 
     # Recommendations
     recs = _get_section(report, "recommendations") or []
     if recs:
-        lis = []
-        for r in recs:
-            text = r.get("text", "")
-            priority = r.get("priority", "")
-            badge = ""
-            if priority == "high":
-                badge = '<span class="priority-high">high</span>'
-            elif priority == "medium":
-                badge = '<span class="priority-medium">medium</span>'
-            lis.append(f"<li>{text}{badge}</li>")
-        recs_html = f"<ul>{''.join(lis)}</ul>"
+        lis = "".join([
+            f"<li>{_esc(r.get('text', ''))}{_priority_badge(_PRIORITY_HTML, r.get('priority'))}</li>" for r in recs
+        ])
+        recs_html = f"<ul>{lis}</ul>"
     else:
-        recs_html = "<p>(none)</p>"
+        recs_html = _EMPTY_HTML
 
     # Resume Bullets
     resume = _get_section(report, "resume_bullets") or []
@@ -511,22 +532,22 @@ def render_html(report: dict) -> str:
     # LinkedIn
     linkedin_sentences = _get_section(report, "linkedin").get("sentences", [])
     if linkedin_sentences:
-        text = " ".join(s.strip() for s in linkedin_sentences if s)
+        text = _esc(" ".join(s.strip() for s in linkedin_sentences if s))
         linkedin_html = f'<blockquote class="linkedin">{text}</blockquote>'
     else:
-        linkedin_html = "<p>(none)</p>"
+        linkedin_html = _EMPTY_HTML
 
     # Highlights
     highlights = _get_section(report, "highlights") or []
     if highlights:
         lis = []
         for h in highlights:
-            t = h.get("title", "")
-            r = h.get("rationale", "")
+            t = _esc(h.get("title", ""))
+            r = _esc(h.get("rationale", ""))
             lis.append(f"<li><strong>{t}</strong> — {r}</li>" if r else f"<li><strong>{t}</strong></li>")
         highlights_html = f"<ul>{''.join(lis)}</ul>"
     else:
-        highlights_html = "<p>(none)</p>"
+        highlights_html = _EMPTY_HTML
 
     insights_html = _render_insights_html(report)
 
@@ -534,7 +555,7 @@ def render_html(report: dict) -> str:
     timeline = _get_section(report, "timeline") or []
     if timeline:
         rows = "".join(
-            f"<tr><td>{r.get('date','')}</td><td>{r.get('event','')}</td></tr>"
+            f"<tr><td>{_esc(r.get('date', ''))}</td><td>{_esc(r.get('event', ''))}</td></tr>"
             for r in timeline
         )
         timeline_html = (
@@ -542,41 +563,25 @@ def render_html(report: dict) -> str:
             f"<tbody>{rows}</tbody></table>"
         )
     else:
-        timeline_html = "<p>(none)</p>"
+        timeline_html = _EMPTY_HTML
 
     # Tech Inventory
     tech = _get_section(report, "tech_inventory") or {}
     if tech:
         rows = []
-        for label, key in (
-            ("Languages", "languages"),
-            ("Frameworks / Libs", "frameworks"),
-            ("AI Tools", "ai_tools"),
-            ("Infra / Tooling", "infra"),
-        ):
-            items = ", ".join(_ensure_list(tech.get(key)))
+        for label, key in _TECH_CATEGORIES:
+            items = ", ".join([str(x) for x in _ensure_list(tech.get(key)) if x is not None])
             if items:
-                rows.append(f"<tr><td>{label}</td><td>{items}</td></tr>")
+                rows.append(f"<tr><td>{label}</td><td>{_esc(items)}</td></tr>")
         tech_html = (
             "<table><thead><tr><th>Category</th><th>Items</th></tr></thead>"
             f"<tbody>{''.join(rows)}</tbody></table>"
         )
     else:
-        tech_html = "<p>(none)</p>"
-
-    body = "\n".join([
-        article("Overview", overview_html),
-        article("Key Changes", key_changes_html),
-        article("Recommendations", recs_html),
-        '<hr class="section-divider">',
-        article("Resume Bullets", resume_html),
-        article("LinkedIn", linkedin_html),
-        '<hr class="section-divider">',
-        article("Highlights", highlights_html),
-        article("Insights", insights_html) if insights_html else "",
-        article("Timeline", timeline_html),
-        article("Tech Inventory", tech_html),
-    ])
+        tech_html = _EMPTY_HTML
+
+    if insights_html:
+        insights_html = f"<article>\n<h2>Insights</h2>\n{insights_html}\n</article>"
 
     return f"""<!doctype html>
 <html lang="en">
@@ -593,33 +598,85 @@ def render_html(report: dict) -> str:
       <div class="subhead">{resume_header}</div>
       <p class="meta">Generated: {generated_at}</p>
     </header>
-    {body}
+    <article>
+<h2>Overview</h2>
+{overview_html}
+</article>
+<article>
+<h2>Key Changes</h2>
+{key_changes_html}
+</article>
+<article>
+<h2>Recommendations</h2>
+{recs_html}
+</article>
+<hr class="section-divider">
+<article>
+<h2>Resume Bullets</h2>
+{resume_html}
+</article>
+<article>
+<h2>LinkedIn</h2>
+{linkedin_html}
+</article>
+<hr class="section-divider">
+<article>
+<h2>Highlights</h2>
+{highlights_html}
+</article>
+{insights_html}
+<article>
+<h2>Timeline</h2>
+{timeline_html}
+</article>
+<article>
+<h2>Tech Inventory</h2>
+{tech_html}
+</article>
   </main>
 </body>
 </html>
 """
 
 
+def _load_report(raw: bytes | str) -> dict:
+    """Parse Phase 2 JSON, via orjson when it is installed.
+
+    orjson reads UTF-8 bytes natively; on a decode error the stdlib parser
+    gets the input, since it accepts NaN/Infinity and reports the position.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Render dev-activity-report JSON to Markdown/HTML.")
-    parser.add_argument("--input", required=True, type=Path, help="Phase 2 JSON input file")
+    parser.add_argument("--input", required=True, type=Path, help="Phase 2 JSON input file ('-' reads stdin)")
     parser.add_argument("--output-dir", required=True, type=Path, help="Output directory")
     parser.add_argument("--base-name", required=True, help="Base filename (no extension)")
     parser.add_argument("--formats", default="md", help="Comma-separated output formats: md,html")
     args = parser.parse_args()
 
-    report = json.loads(args.input.read_text(encoding="utf-8"))
-    formats = [f.strip().lower() for f in args.formats.split(",") if f.strip()]
+    if str(args.input) == "-":
+        report = _load_report(sys.stdin.read())
+    else:
+        report = _load_report(args.input.read_bytes())
+    formats = {f.strip().lower() for f in args.formats.split(",")}
 
     args.output_dir.mkdir(parents=True, exist_ok=True)
+    if "md" in formats and "html" in formats:
+        # Both renderers read linked insights; resolve them once.
+        report = resolve_insight_links(report)
 
     if "md" in formats:
-        md_text = render_markdown(report)
-        (args.output_dir / f"{args.base_name}.md").write_text(md_text, encoding="utf-8")
+        (args.output_dir / f"{args.base_name}.md").write_text(render_markdown(report), encoding="utf-8")
 
     if "html" in formats:
-        html_text = render_html(report)
-        (args.output_dir / f"{args.base_name}.html").write_text(html_text, encoding="utf-8")
+        (args.output_dir / f"{args.base_name}.html").write_text(render_html(report), encoding="utf-8")
 
 
 if __name__ == "__main__":
@@ -189,11 +189,13 @@ def run_interactive_review(
     output_fn: OutputFn = print,
 ) -> tuple[dict, bool]:
     """Review core sections and allow small edits without model calls."""
-    updated = deepcopy(report_obj)
-    sections = updated.get("sections")
+    # Only sections are edited: deep-copy those, share everything else
+    # (source_payload can be the whole Phase 1 payload) by reference.
+    updated = dict(report_obj)
+    sections = deepcopy(updated.get("sections"))
     if not isinstance(sections, dict):
         sections = {}
-        updated["sections"] = sections
+    updated["sections"] = sections
 
     output_fn("Interactive review enabled. Edit JSON now; rendering runs after this step.")
     output_fn("Use short commands only. Press Enter repeatedly to accept all sections.")
@@ -18,12 +18,16 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import html
 import json
 import os
+import random
 import re
 import shlex
 import shutil
+import signal
 import tempfile
 import urllib.parse
 import subprocess
@@ -31,6 +35,12 @@ import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
 
 # ── Resolve paths ─────────────────────────────────────────────────────────────
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -39,22 +49,40 @@ ENV_FILE = SKILL_DIR / ".env"
 
 
 # ── Env loader ────────────────────────────────────────────────────────────────
-def load_env() -> dict[str, str]:
+def _parse_env_text(text: str) -> dict[str, str]:
+    """One-pass KEY=VALUE parse; strips one pair of matching surrounding quotes."""
     env: dict[str, str] = {}
-    if not ENV_FILE.exists():
-        return env
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, val = line.partition("=")
+        if not sep:
+            continue
+        val = val.strip()
+        if len(val) >= 2 and val[0] == val[-1] and val[0] in "\"'":
+            val = val[1:-1]
+        env[key.strip()] = val
+    return env
+
+
+@functools.lru_cache(maxsize=4)
+def _read_env_file(path: str, mtime_ns: int, size: int) -> dict[str, str]:
+    """Parse an env file once per (path, mtime_ns, size); callers get copies."""
     try:
         from dotenv import dotenv_values  # type: ignore
-        env.update({k: v for k, v in dotenv_values(ENV_FILE).items() if v is not None})
-        return env
+        return {k: v for k, v in dotenv_values(path).items() if v is not None}
     except ImportError:
         pass
-    for line in ENV_FILE.read_text().splitlines():
-        stripped = line.strip()
-        if "=" in stripped and not stripped.startswith("#"):
-            k, v = stripped.split("=", 1)
-            env[k.strip()] = v.strip()
-    return env
+    return _parse_env_text(Path(path).read_text())
+
+
+def load_env() -> dict[str, str]:
+    try:
+        st = ENV_FILE.stat()
+    except OSError:
+        return {}
+    return dict(_read_env_file(str(ENV_FILE), st.st_mtime_ns, st.st_size))
 
 
 def expand(val: str) -> str:
@@ -93,21 +121,33 @@ def resolve_since(env: dict[str, str], cli_since: str | None = None) -> str | No
     return None
 
 
-def env_bool(env: dict[str, str], key: str, default: bool = False) -> bool:
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+# USE_CODEX and PHASE15_THOROUGH also accept the single-letter forms.
+_TRUTHY_FLAGS = _TRUTHY | {"y", "t"}
+
+
+def env_bool(env: dict[str, str], key: str, default: bool = False, truthy: frozenset = _TRUTHY) -> bool:
+    """Truthiness rule for .env flags: 1/true/yes/on (or `truthy`), case-insensitive."""
     raw = env.get(key, "")
     if not raw:
         return default
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
+    return raw.strip().lower() in truthy
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str, search_path: str | None) -> str | None:
+    # Keyed on the PATH value, so a changed PATH is a fresh lookup.
+    return shutil.which(name, path=search_path)
 
 
 def find_claude_bin() -> str | None:
     """Find the claude CLI binary."""
-    return shutil.which("claude")
+    return _which("claude", os.environ.get("PATH"))
 
 
 def find_codex_bin() -> str | None:
     """Find the codex CLI binary."""
-    return shutil.which("codex")
+    return _which("codex", os.environ.get("PATH"))
 
 
 def is_openai_model(model: str) -> bool:
@@ -120,7 +160,7 @@ def is_openai_model(model: str) -> bool:
 
 
 def should_use_codex_for_model(model: str, env: dict[str, str]) -> bool:
-    return env_bool(env, "USE_CODEX", default=False) and is_openai_model(model)
+    return env_bool(env, "USE_CODEX", default=False, truthy=_TRUTHY_FLAGS) and is_openai_model(model)
 
 
 # ── Notify helper ─────────────────────────────────────────────────────────────
@@ -149,6 +189,8 @@ def slugify(value: str) -> str:
 def expand_compact_payload(compact: dict) -> dict:
     projects = []
     for proj in compact.get("p", []) or []:
+        if not isinstance(proj, dict):  # malformed entry (None, str, ...): drop it
+            continue
         projects.append(
             {
                 "name": proj.get("n", ""),
@@ -166,6 +208,8 @@ def expand_compact_payload(compact: dict) -> dict:
 
     ownership_markers = []
     for marker in compact.get("mk", []) or []:
+        if not isinstance(marker, dict):
+            continue
         ownership_markers.append(
             {
                 "marker": marker.get("m", ""),
@@ -175,6 +219,8 @@ def expand_compact_payload(compact: dict) -> dict:
 
     extra_scan_dirs = []
     for item in compact.get("x", []) or []:
+        if not isinstance(item, dict):
+            continue
         extra_scan_dirs.append(
             {
                 "path": item.get("p", ""),
@@ -206,7 +252,7 @@ def expand_compact_payload(compact: dict) -> dict:
             "active_workdirs": codex.get("cw", []) or [],
             "skills": codex.get("sk", []) or [],
         },
-        "insights": compact.get("ins", []) or [],
+        "insights": [line for line in compact.get("ins", []) or [] if isinstance(line, str)],
         "insights_meta": compact.get("insm", {}) or {},
         "stats": {
             "total": stats.get("total"),
@@ -258,24 +304,31 @@ KEY_LABEL_MAP = {
 }
 
 
+# Every accepted spelling of a compact key ("mk", "MK", "Mk") -> its label.
+_LABEL_VARIANTS = {
+    variant: label
+    for key, label in KEY_LABEL_MAP.items()
+    for variant in (key, key.upper(), key.capitalize())
+}
+# Leading "**key**" or the first token ending at ":" / " " / end of text.
+_LABEL_TOKEN = re.compile(r"\*\*([^*]+)\*\*|[^ :]+")
+
+
 def normalize_label(text: str) -> str:
     if not text:
         return text
     stripped = text.strip()
-    for key, label in KEY_LABEL_MAP.items():
-        variants = {key, key.upper(), key.capitalize()}
-        for variant in variants:
-            if stripped == variant:
-                return label
-            if stripped.startswith(f"**{variant}**"):
-                return label + stripped[len(f"**{variant}**"):]
-            for sep in (":", " ", " —", " -"):
-                if stripped.startswith(variant + sep):
-                    return label + stripped[len(variant):]
-    return text
+    match = _LABEL_TOKEN.match(stripped)
+    if match is None:
+        return text
+    label = _LABEL_VARIANTS.get(match.group(1) or match.group(0))
+    if label is None:
+        return text
+    return label + stripped[match.end():]
 
 
 def normalize_sections(sections: dict) -> dict:
+    """Expand compact labels in key_changes in place; returns the same dict (no copies)."""
     key_changes = sections.get("key_changes")
     if isinstance(key_changes, list):
         for item in key_changes:
@@ -286,7 +339,9 @@ def normalize_sections(sections: dict) -> dict:
                 item["title"] = normalize_label(title)
             bullets = item.get("bullets")
             if isinstance(bullets, list):
-                item["bullets"] = [normalize_label(b) if isinstance(b, str) else b for b in bullets]
+                for i, bullet in enumerate(bullets):
+                    if isinstance(bullet, str):
+                        bullets[i] = normalize_label(bullet)
     return sections
 
 
@@ -296,6 +351,13 @@ def path_to_file_url(path: str) -> str:
     return Path(path).resolve().as_uri()
 
 
+# HTML-to-text patterns for the insights report, compiled once at import.
+_HTML_SCRIPT_STYLE = re.compile(r"(?is)<(script|style)[^>]*>.*?</\1>")
+_HTML_BR = re.compile(r"(?i)<br\s*/?>")
+_HTML_BLOCK_END = re.compile(r"(?i)</(p|li|h1|h2|h3|h4|h5|h6|div|section|article)>")
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+
 def _extract_insights_text_lines(path: Path) -> list[str]:
     try:
         raw = path.read_text(encoding="utf-8", errors="ignore")
@@ -303,10 +365,10 @@ def _extract_insights_text_lines(path: Path) -> list[str]:
         return []
 
     # Lightweight HTML-to-text extraction without extra dependencies.
-    raw = re.sub(r"(?is)<(script|style)[^>]*>.*?</\1>", " ", raw)
-    raw = re.sub(r"(?i)<br\s*/?>", "\n", raw)
-    raw = re.sub(r"(?i)</(p|li|h1|h2|h3|h4|h5|h6|div|section|article)>", "\n", raw)
-    raw = re.sub(r"(?s)<[^>]+>", " ", raw)
+    raw = _HTML_SCRIPT_STYLE.sub(" ", raw)
+    raw = _HTML_BR.sub("\n", raw)
+    raw = _HTML_BLOCK_END.sub("\n", raw)
+    raw = _HTML_TAG.sub(" ", raw)
     text = html.unescape(raw)
 
     lines: list[str] = []
@@ -317,6 +379,13 @@ def _extract_insights_text_lines(path: Path) -> list[str]:
     return lines
 
 
+# Quote selections per (report state, bins, env): a run asks for the same
+# quotes for the Phase 2 prompt and again for the final report JSON, and each
+# miss costs an HTML parse plus a model call. Only non-empty results are kept,
+# so a failed extraction is retried on the next request.
+_INSIGHTS_ENTRIES_CACHE: dict[tuple, list[dict[str, str]]] = {}
+
+
 def extract_insights_quote_entries(
     env: dict[str, str],
     claude_bin: str | None = None,
@@ -327,12 +396,30 @@ def extract_insights_quote_entries(
         return [], ""
 
     path = Path(expand(env.get("INSIGHTS_REPORT_PATH", "~/.claude/usage-data/report.html")))
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return [], str(path)
 
+    key = (str(path), st.st_mtime_ns, st.st_size, claude_bin, codex_bin, frozenset(env.items()))
+    cached = _INSIGHTS_ENTRIES_CACHE.get(key)
+    if cached is None:
+        cached = _select_insights_quote_entries(path, env, claude_bin, codex_bin)
+        if cached:
+            _INSIGHTS_ENTRIES_CACHE[key] = cached
+    # Callers get their own dicts; the cached selection stays pristine.
+    return [dict(entry) for entry in cached], str(path)
+
+
+def _select_insights_quote_entries(
+    path: Path,
+    env: dict[str, str],
+    claude_bin: str | None,
+    codex_bin: str | None,
+) -> list[dict[str, str]]:
     lines = _extract_insights_text_lines(path)
     if not lines:
-        return [], str(path)
+        return []
 
     max_quotes = int(env.get("CLAUDE_INSIGHTS_QUOTES_MAX", 8) or 8)
     max_chars = int(env.get("CLAUDE_INSIGHTS_QUOTES_MAX_CHARS", 2000) or 2000)
@@ -384,7 +471,7 @@ def extract_insights_quote_entries(
                     f"[insights] LLM quote extraction failed; heuristic fallback disabled: {exc}",
                     file=sys.stderr,
                 )
-                return [], source_path
+                return []
             quotes = []
     else:
         if not allow_heuristic_fallback:
@@ -392,7 +479,7 @@ def extract_insights_quote_entries(
                 "[insights] No LLM runtime available for quote extraction; heuristic fallback disabled.",
                 file=sys.stderr,
             )
-            return [], source_path
+            return []
 
     if not quotes and allow_heuristic_fallback:
         keywords = (
@@ -401,7 +488,10 @@ def extract_insights_quote_entries(
             "tokens", "hours", "commits", "files", "sessions", "productivity",
         )
         candidates: list[str] = []
+        seen: set[str] = set()
         for line in lines:
+            if len(candidates) >= max_quotes:
+                break  # selection below never reads past max_quotes
             # Skip lines that look like CSS/code artifacts
             if "{" in line or "}" in line or line.startswith("--") or line.startswith("."):
                 continue
@@ -415,11 +505,12 @@ def extract_insights_quote_entries(
                 or any(k in lower for k in keywords)
                 or len(cleaned.split()) >= 9
             )
-            if is_candidate and cleaned not in candidates:
+            if is_candidate and cleaned not in seen:
+                seen.add(cleaned)
                 candidates.append(cleaned)
         quotes = candidates
     elif not quotes:
-        return [], source_path
+        return []
     selected: list[dict[str, str]] = []
     total = 0
     for line in quotes:
@@ -435,7 +526,7 @@ def extract_insights_quote_entries(
         total += len(line)
         if len(selected) >= max_quotes:
             break
-    return selected, source_path
+    return selected
 
 
 def parse_insights_sections(insights_lines: list[str], env: dict[str, str]) -> dict:
@@ -455,14 +546,15 @@ def parse_insights_sections(insights_lines: list[str], env: dict[str, str]) -> d
         if not current_title:
             return
         section_id = slugify(current_title) or "insights"
+        anchor = urllib.parse.quote(section_id)
         sections.append(
             {
                 "id": section_id,
                 "title": current_title,
                 "entry_date": current_date,
-                "content": content[:],
-                "link": f"{log_url}#{urllib.parse.quote(section_id)}" if log_url else "",
-                "report_link": f"{report_url}#{urllib.parse.quote(section_id)}" if report_url else "",
+                "content": content,  # rebound to a fresh list below, so no copy
+                "link": f"{log_url}#{anchor}" if log_url else "",
+                "report_link": f"{report_url}#{anchor}" if report_url else "",
             }
         )
         current_title = ""
@@ -472,15 +564,14 @@ def parse_insights_sections(insights_lines: list[str], env: dict[str, str]) -> d
         line = (raw or "").strip()
         if not line:
             continue
-        if line.startswith("## "):
-            flush_current()
-            current_date = line[3:].strip()
-            continue
-        if line.startswith("### "):
-            flush_current()
-            current_title = line[4:].strip()
-            continue
-        if line.startswith("#"):
+        if line[0] == "#":
+            # Headings only; most lines are content and skip these prefix tests.
+            if line.startswith("## "):
+                flush_current()
+                current_date = line[3:].strip()
+            elif line.startswith("### "):
+                flush_current()
+                current_title = line[4:].strip()
             continue
         if not current_title:
             current_title = "Insights Notes"
@@ -499,29 +590,188 @@ def parse_insights_sections(insights_lines: list[str], env: dict[str, str]) -> d
     }
 
 
-def parse_llm_json_output(raw_text: str) -> dict:
-    """Parse JSON object from LLM output, tolerating markdown code fences."""
-    decoder = json.JSONDecoder()
-    text = (raw_text or "").strip()
-    candidates = [text]
+def loads_json(text: str):
+    """json.loads, via orjson for ASCII text when it is installed.
+
+    Non-ASCII text stays on the stdlib scanner, which beats orjson's UTF-8
+    re-encode there.
+    """
+    if orjson is not None and text.isascii():
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# json.dumps(obj, separators=(",", ":")) without building an encoder per call.
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _has_float(obj) -> bool:
+    """True if a float appears anywhere in obj's dicts/lists/tuples (iterative walk)."""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is float:
+            return True
+        if kind is dict:
+            stack.extend(item.values())
+        elif kind is list or kind is tuple:
+            stack.extend(item)
+    return False
+
+
+def dumps_compact(obj) -> str:
+    """json.dumps(obj, separators=(",", ":")), via orjson when it is installed.
+
+    orjson leaves non-ASCII raw where the stdlib escapes it, rejects non-str
+    keys, writes exponents as 1e16 / 1e-7 (stdlib: 1e+16 / 1e-07) and turns
+    NaN/Infinity into null; all of these fall back to the stdlib encoder, so
+    the output never depends on whether orjson is installed.
+    """
+    if orjson is not None and not _has_float(obj):
+        try:
+            text = orjson.dumps(obj).decode()
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            pass
+        else:
+            if text.isascii():
+                return text
+    return _COMPACT_ENCODER.encode(obj)
+
+
+def last_json_line(text: str) -> str:
+    """Return the last line of text that starts with "{" (stripped), or "".
+
+    Scans backwards with rfind so the (large) JSON line is not split apart
+    character by character.
+    """
+    end = len(text)
+    while end > 0:
+        start = text.rfind("\n", 0, end) + 1
+        line = text[start:end].strip()
+        if line.startswith("{"):
+            return line
+        end = start - 1
+    return ""
 
+
+_JSON_STRUCTURAL = re.compile(r'[{}"]')
+
+
+def _scan_json_object(text: str) -> int:
+    """Start index of the {...} object that closes at the end of `text`, or -1.
+
+    Walks the structural characters backwards from the final "}" with a
+    quote-aware depth counter, so braces inside JSON strings are ignored, and
+    stops at the "{" that balances it; prose before the object (stray braces
+    or quotes included) is never scanned. Returns -1 when that object is
+    itself a nested value (preceded by `"key":`, `[` or `,`), i.e. the tail
+    of truncated output. One O(n) pass.
+    """
+    if not text.endswith("}"):
+        return -1
+    depth = 0
+    in_string = False
+    for m in reversed(list(_JSON_STRUCTURAL.finditer(text))):
+        i = m.start()
+        ch = text[i]
+        if ch == '"':
+            slashes = 0
+            while i - slashes > 0 and text[i - slashes - 1] == "\\":
+                slashes += 1
+            if not slashes % 2:
+                in_string = not in_string
+        elif in_string:
+            continue
+        elif ch == "}":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return -1 if _is_nested_value(text[:i].rstrip()) else i
+    return -1
+
+
+def _is_nested_value(before: str) -> bool:
+    """True if text ending in `before` continues with a JSON value (after `"key":`, `[` or `,`)."""
+    if before.endswith(("[", ",")):
+        return True
+    return before.endswith(":") and before[:-1].rstrip().endswith('"')
+
+
+def _candidate_starts(chunk: str) -> Iterator[int]:
+    """Offsets to try decoding from, cheapest first; the scan runs only if both
+    the whole chunk and the first "{" fail to decode."""
+    yield 0
+    yield chunk.find("{")
+    yield _scan_json_object(chunk)
+    yield chunk.find("[")
+
+
+def _fenced_body(text: str) -> str | None:
+    """Body of the first ``` fenced block in text (prose around it allowed), or None.
+
+    Drops the info line ("json") and ends at the closing line-initial ```; a
+    JSON string cannot hold a raw newline, so "\n```" never matches inside the
+    object. The usual closing fence on the last line is checked from the end
+    first, sparing a forward search through the whole body.
+    """
+    _, fence, rest = text.partition("```")
+    if not fence:
+        return None
+    nl = rest.find("\n")
+    body = rest[nl + 1 :] if nl >= 0 else ""
+    last = body.rpartition("\n")[2]
+    if last.strip() == "```":
+        return body[: len(body) - len(last)].strip()
+    end = body.find("\n```")
+    return (body[:end] if end >= 0 else body).strip()
+
+
+def _json_candidates(text: str) -> Iterator[str]:
+    """Texts to decode from, in order. A leading fence is peeled first; otherwise
+    the whole reply is tried before paying for a full-text fence search."""
     if text.startswith("```"):
-        lines = text.splitlines()
-        if lines and lines[0].startswith("```"):
-            lines = lines[1:]
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        candidates.insert(0, "\n".join(lines).strip())
+        yield _fenced_body(text) or ""
+        yield text
+        return
+    yield text
+    body = _fenced_body(text)
+    if body is not None:
+        yield body
+
+
+# Stateless and reentrant; one instance serves every parse.
+_DECODER = json.JSONDecoder()
 
+
+def parse_llm_json_output(raw_text: str) -> dict:
+    """Parse JSON object from LLM output, tolerating markdown code fences."""
+    text = (raw_text or "").strip()
     last_err: json.JSONDecodeError | None = None
-    for candidate in candidates:
+    for candidate in _json_candidates(text):
         chunk = candidate.strip()
-        for pos in (0, chunk.find("{"), chunk.find("[")):
-            if pos < 0:
+        tried: set[int] = set()
+        for pos in _candidate_starts(chunk):
+            if pos < 0 or pos in tried:
                 continue
+            tried.add(pos)
             snippet = chunk[pos:].lstrip()
+            if orjson is not None and snippet.isascii():
+                # Native parse of the whole snippet. Non-ASCII text is left to the
+                # stdlib scanner, which beats orjson's UTF-8 re-encode there; on
+                # failure the stdlib decoder supplies the error position and
+                # accepts NaN/Infinity.
+                try:
+                    obj = orjson.loads(snippet)
+                except orjson.JSONDecodeError:
+                    pass
+                else:
+                    if not isinstance(obj, dict):
+                        raise json.JSONDecodeError("Top-level JSON must be an object", snippet, 0)
+                    return obj
             try:
-                obj, end = decoder.raw_decode(snippet)
+                obj, end = _DECODER.raw_decode(snippet)
             except json.JSONDecodeError as exc:
                 last_err = exc
                 continue
@@ -536,7 +786,113 @@ def parse_llm_json_output(raw_text: str) -> dict:
     raise json.JSONDecodeError("No JSON object found in model output", text, 0)
 
 
+PHASE2_SECTION_KEYS = frozenset(
+    ("overview", "key_changes", "recommendations", "resume_bullets",
+     "linkedin", "highlights", "timeline", "tech_inventory")
+)
+
+
+# Container type per Phase 2 section (tests/contracts/phase2_output.schema.json).
+_PHASE2_SECTION_TYPES = {
+    "overview": dict, "key_changes": list, "recommendations": list, "resume_bullets": list,
+    "linkedin": dict, "highlights": list, "timeline": list, "tech_inventory": dict,
+    "insights_quotes": list,
+}
+
+
+def phase2_shape_errors(sections: object) -> list[str]:
+    """Structural check of parsed Phase 2 sections; [] when the renderer can consume them.
+
+    Cheap second pass, run only once the JSON parse has succeeded. Missing
+    or null sections are allowed (rendered as "(none)").
+    """
+    if not isinstance(sections, dict):
+        return [f"sections: expected object, got {type(sections).__name__}"]
+    errors = []
+    for key, expected in _PHASE2_SECTION_TYPES.items():
+        value = sections.get(key)
+        if value is not None and not isinstance(value, expected):
+            kind = "object" if expected is dict else "array"
+            errors.append(f"{key}: expected {kind}, got {type(value).__name__}")
+    return errors
+
+
+def split_phase2_output(obj: dict) -> tuple[dict, dict] | None:
+    """Return (sections, render_hints) from a Phase 2 object, or None if it has no sections.
+
+    Accepts the {"sections": ..., "render_hints": ...} envelope and a bare
+    sections object carrying any known section key at top level.
+    """
+    if "sections" in obj:
+        return obj.get("sections") or {}, obj.get("render_hints") or {}
+    if not PHASE2_SECTION_KEYS.isdisjoint(obj):
+        return obj, {}
+    return None
+
+
+# ── Subprocess helper ─────────────────────────────────────────────────────────
+def _kill_process_tree(proc: subprocess.Popen) -> None:
+    """Kill proc and every process in its session (POSIX) or tree (Windows)."""
+    try:
+        if os.name == "nt":
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                capture_output=True,
+                check=False,
+            )
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError):
+        proc.kill()
+
+
+def run_with_deadline(
+    cmd: list[str],
+    timeout: float,
+    env: dict[str, str] | None = None,
+    input: str | None = None,
+) -> subprocess.CompletedProcess:
+    """subprocess.run(capture_output=True, text=True) whose timeout is a hard deadline.
+
+    The child gets its own session/process group. On timeout (or Ctrl-C) the
+    whole group is killed before re-raising, so grandchildren that inherited
+    the output pipes cannot keep communicate() blocked past the deadline.
+    """
+    group_kwargs: dict[str, object] = (
+        {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP} if os.name == "nt" else {"start_new_session": True}
+    )
+    with subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if input is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        **group_kwargs,
+    ) as proc:
+        try:
+            stdout, stderr = proc.communicate(input, timeout=timeout)
+        except BaseException:
+            _kill_process_tree(proc)
+            try:
+                proc.communicate(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+            raise
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
 # ── Claude CLI helper ─────────────────────────────────────────────────────────
+# Transient claude CLI failures (rate limits, overload, gateway errors) are
+# retried with backoff; anything else fails on the first attempt. A hard
+# deadline (TimeoutExpired) is never retried.
+CLAUDE_RETRY_ATTEMPTS = 3
+CLAUDE_RETRY_BASE_S = 1.0
+_CLAUDE_RETRYABLE = re.compile(
+    r"rate.?limit|overloaded|\b(?:429|502|503|529)\b|timed?.?out", re.IGNORECASE
+)
+
+
 def claude_call(
     prompt: str,
     model: str,
@@ -549,6 +905,7 @@ def claude_call(
     Call `claude -p <prompt> --model <model> --output-format json`.
     Returns (text, usage_dict).
     Unsets CLAUDECODE to bypass nested-session guard.
+    Retries transient failures (see _CLAUDE_RETRYABLE) up to CLAUDE_RETRY_ATTEMPTS.
     """
     env = os.environ.copy()
     env.pop("CLAUDECODE", None)
@@ -564,17 +921,15 @@ def claude_call(
     if system_prompt:
         cmd += ["--system-prompt", system_prompt]
 
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=timeout,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"claude CLI failed (rc={result.returncode}):\n{result.stderr.strip()}"
-        )
+    for attempt in range(CLAUDE_RETRY_ATTEMPTS):
+        result = run_with_deadline(cmd, timeout=timeout, env=env)
+        if result.returncode == 0:
+            break
+        err = result.stderr.strip()
+        if attempt == CLAUDE_RETRY_ATTEMPTS - 1 or not _CLAUDE_RETRYABLE.search(err):
+            raise RuntimeError(f"claude CLI failed (rc={result.returncode}):\n{err}")
+        # Exponential backoff with jitter: base * 2^attempt * [0.5, 1.5)
+        time.sleep(CLAUDE_RETRY_BASE_S * (2 ** attempt) * (0.5 + random.random()))
 
     raw = result.stdout.strip()
     # --output-format json returns a JSON object with result and usage
@@ -640,13 +995,7 @@ def codex_exec_call(
         cmd.extend(["--add-dir", add_dir])
     cmd.append("-")
     try:
-        result = subprocess.run(
-            cmd,
-            input=final_prompt,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
+        result = run_with_deadline(cmd, timeout=timeout, input=final_prompt)
         if result.returncode != 0:
             err = (result.stderr or "").strip()
             if "Not inside a trusted directory" in err and "--skip-git-repo-check" not in extra_flags:
@@ -759,10 +1108,12 @@ def extract_insights_quotes(
         claude_bin=claude_bin,
         codex_bin=codex_bin,
     )
-    if not entries:
-        return "", source
-    block = "\n".join(f'- "{item.get("quote", "")}"' for item in entries if item.get("quote"))
-    return block, source
+    return format_insights_block(entries), source
+
+
+def format_insights_block(entries: list[dict[str, str]]) -> str:
+    """Bulleted quote lines for the Phase 2 prompt ("" when there are none)."""
+    return "\n".join(f'- "{item.get("quote", "")}"' for item in entries if item.get("quote"))
 
 
 def call_phase2(
@@ -781,19 +1132,16 @@ def call_phase2(
             "Additional user rules from .env (apply without changing the JSON schema):\n"
             f"{extra_rules}\n\n"
         )
-    insights_block, insights_source = extract_insights_quotes(
-        env,
-        claude_bin=claude_bin,
-        codex_bin=codex_bin,
-    )
-    insight_quote_entries, _ = extract_insights_quote_entries(
+    # One extraction feeds both the quote bullets and the reference JSON.
+    insight_quote_entries, insights_source = extract_insights_quote_entries(
         env,
         claude_bin=claude_bin,
         codex_bin=codex_bin,
     )
+    insights_block = format_insights_block(insight_quote_entries)
     insights_prompt_block = ""
     if insights_block:
-        quotes_json = json.dumps(insight_quote_entries, separators=(",", ":"))
+        quotes_json = dumps_compact(insight_quote_entries)
         insights_prompt_block = (
             f"Claude insights report excerpts (source: {insights_source}):\n"
             f"{insights_block}\n\n"
@@ -854,7 +1202,7 @@ def call_phase15_claude(
     codex_bin: str | None = None,
 ) -> tuple[str, dict[str, int]]:
     model = env.get("PHASE15_MODEL", "haiku")
-    thorough = env.get("PHASE15_THOROUGH", "false").strip().lower() in {"1", "true", "yes", "on"}
+    thorough = env_bool(env, "PHASE15_THOROUGH", truthy=_TRUTHY_FLAGS)
     prompt = PHASE15_THOROUGH_TMPL if thorough else PHASE15_TERSE_TMPL
     extra_rules = (env.get("PHASE15_RULES_EXTRA") or env.get("PHASE15_PROMPT_PREFIX") or "").strip()
     if extra_rules:
@@ -866,7 +1214,7 @@ def call_phase15_claude(
     prompt = (
         f"{prompt}\n\n"
         "Summary JSON (read-only context; do not rewrite it):\n"
-        f"{json.dumps(summary, separators=(',', ':'))}"
+        f"{dumps_compact(summary)}"
     )
     timeout = int(env.get("PHASE15_TIMEOUT", 180))
     return call_model(
@@ -965,10 +1313,63 @@ def record_benchmark(
         bmark_file = output_dir / "benchmarks.jsonl"
     bmark_file.parent.mkdir(parents=True, exist_ok=True)
     with bmark_file.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+        fh.write(_COMPACT_ENCODER.encode(record) + "\n")
     print(f"  Benchmark logged: {bmark_file}", flush=True)
 
 
+# ── Phase checkpoint ──────────────────────────────────────────────────────────
+# Model outputs of Phase 1.5 / Phase 2 are saved after each succeeds so a run
+# that fails later (Phase 2 parse, render) resumes without repeating model
+# calls. Valid only for the same Phase 1 fingerprint, since filter, models and
+# prompt settings; removed once the report renders.
+CHECKPOINT_FILE = ".pipeline-checkpoint.json"
+# .env keys that change the Phase 1.5 / Phase 2 prompts (rules, insights excerpts).
+CHECKPOINT_PROMPT_KEYS = (
+    "PHASE15_THOROUGH",
+    "PHASE15_RULES_EXTRA",
+    "PHASE15_PROMPT_PREFIX",
+    "PHASE2_RULES_EXTRA",
+    "PHASE2_PROMPT_PREFIX",
+    "RESUME_HEADER",
+    "INSIGHTS_REPORT_PATH",
+    "INCLUDE_CLAUDE_INSIGHTS_QUOTES",
+    "CLAUDE_INSIGHTS_QUOTES_MAX",
+    "CLAUDE_INSIGHTS_QUOTES_MAX_CHARS",
+    "INSIGHTS_QUOTES_MODEL",
+)
+
+
+def prompt_settings_digest(env: dict[str, str]) -> str:
+    """Digest of the CHECKPOINT_PROMPT_KEYS values, so a rules edit invalidates the checkpoint."""
+    h = hashlib.sha256()
+    for key in CHECKPOINT_PROMPT_KEYS:
+        h.update(f"{key}={env.get(key, '')}\0".encode())
+    return h.hexdigest()
+
+
+def read_checkpoint(path: Path, run_key: dict) -> dict:
+    """Return saved phase outputs written for `run_key`, or {}."""
+    try:
+        saved = loads_json(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(saved, dict) or saved.get("key") != run_key:
+        return {}
+    return saved
+
+
+def write_checkpoint(path: Path, state: dict) -> None:
+    tmp = path.with_suffix(".tmp")
+    try:
+        tmp.write_text(json.dumps(state, separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)  # atomic on POSIX
+    except OSError:
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
 # ── Main pipeline ─────────────────────────────────────────────────────────────
 def should_run_interactive(interactive: bool) -> bool:
     if not interactive:
@@ -1087,13 +1488,7 @@ def run(
         print("Phase 1 failed.", file=sys.stderr)
         return 1
 
-    # Find last JSON line in stdout
-    phase1_json_str = ""
-    for line in reversed((result.stdout or "").splitlines()):
-        line = line.strip()
-        if line.startswith("{"):
-            phase1_json_str = line
-            break
+    phase1_json_str = last_json_line(result.stdout or "")
 
     if not phase1_json_str:
         cache_file = SKILL_DIR / ".phase1-cache.json"
@@ -1112,22 +1507,36 @@ def run(
     else:
         if foreground:
             # Print non-JSON lines (progress output) from phase1
-            for line in (result.stdout or "").splitlines():
+            for line in (result.stdout or "").rstrip("\n").split("\n"):
                 if not line.strip().startswith("{"):
                     print(f"  {line}", flush=True)
 
-    phase1_payload = json.loads(phase1_json_str)
+    phase1_payload = loads_json(phase1_json_str)
     cache_hit = phase1_payload.get("cache_hit", False)
     fp = phase1_payload.get("fp", "n/a")
     print(f"  cache_hit={cache_hit}, fp={fp[:16]}…, elapsed={timings['phase1']:.2f}s", flush=True)
     compact_payload = phase1_payload.get("data", phase1_payload)
 
+    checkpoint_path = SKILL_DIR / CHECKPOINT_FILE
+    run_key = {
+        "fp": fp,
+        "since": since_value or "",
+        "models": [phase15_model, phase2_model],
+        "codex": [phase15_uses_codex, phase2_uses_codex],
+        "prompt": prompt_settings_digest(env),
+    }
+    checkpoint = {} if refresh or fp == "n/a" else read_checkpoint(checkpoint_path, run_key)
+
     # ── Phase 1.5: cheap draft ────────────────────────────────────────────────
     print(f"== Phase 1.5 ({phase15_model}): draft ==", flush=True)
     t0 = time.monotonic()
 
     usage15: dict = {"prompt_tokens": 0, "completion_tokens": 0}
-    if phase15_uses_codex:
+    heuristic_draft = False
+    if "draft" in checkpoint:
+        draft_text = checkpoint["draft"]
+        print(f"  resumed draft from checkpoint ({CHECKPOINT_FILE})", flush=True)
+    elif phase15_uses_codex:
         print(f"  USE_CODEX=true; routing Phase 1.5 to codex exec ({phase15_model})", flush=True)
         summary = phase1_payload.get("data", phase1_payload)
         try:
@@ -1184,6 +1593,7 @@ def run(
                     print("Phase 1.5 produced no draft.", file=sys.stderr)
                     return 1
                 print("  Using heuristic fallback draft.", flush=True)
+                heuristic_draft = True
 
     timings["phase15"] = time.monotonic() - t0
     print(
@@ -1191,26 +1601,38 @@ def run(
         f"tokens={usage15}, elapsed={timings['phase15']:.2f}s",
         flush=True,
     )
-    log_tokens("1.5", phase15_model, usage15, env)
+    if "draft" not in checkpoint:
+        log_tokens("1.5", phase15_model, usage15, env)
+        # A heuristic draft stands in for an unreachable model; the next run
+        # should retry the model rather than resume from it.
+        if fp != "n/a" and not heuristic_draft:
+            checkpoint = {"key": run_key, "draft": draft_text}
+            write_checkpoint(checkpoint_path, checkpoint)
 
     # ── Phase 2: polished report ──────────────────────────────────────────────
     print(f"== Phase 2 ({phase2_model}): report ==", flush=True)
     t0 = time.monotonic()
-    compact_json = json.dumps(compact_payload, separators=(",", ":"))
-    try:
-        report_text, usage2 = call_phase2(
-            compact_json,
-            draft_text,
-            env,
-            claude_bin=claude_bin,
-            codex_bin=codex_bin,
-        )
-    except Exception as exc:
-        print(f"Phase 2 failed: {exc}", file=sys.stderr)
-        return 1
+    usage2: dict = {"prompt_tokens": 0, "completion_tokens": 0}
+    if "report_text" in checkpoint:
+        report_text = checkpoint["report_text"]
+        print(f"  resumed report from checkpoint ({CHECKPOINT_FILE})", flush=True)
+    else:
+        compact_json = dumps_compact(compact_payload)
+        try:
+            report_text, usage2 = call_phase2(
+                compact_json,
+                draft_text,
+                env,
+                claude_bin=claude_bin,
+                codex_bin=codex_bin,
+            )
+        except Exception as exc:
+            print(f"Phase 2 failed: {exc}", file=sys.stderr)
+            return 1
     timings["phase2"] = time.monotonic() - t0
     print(f"  tokens={usage2}, elapsed={timings['phase2']:.2f}s", flush=True)
-    log_tokens("2", phase2_model, usage2, env)
+    if "report_text" not in checkpoint:
+        log_tokens("2", phase2_model, usage2, env)
 
     # Parse Phase 2 JSON and write structured output
     try:
@@ -1223,17 +1645,19 @@ def run(
         print("Phase 2 output JSON must be an object.", file=sys.stderr)
         return 1
 
-    if "sections" in phase2_obj:
-        sections = phase2_obj.get("sections") or {}
-        render_hints = phase2_obj.get("render_hints") or {}
-    else:
-        if any(k in phase2_obj for k in ("overview", "key_changes", "recommendations", "resume_bullets",
-                                         "linkedin", "highlights", "timeline", "tech_inventory")):
-            sections = phase2_obj
-            render_hints = {}
-        else:
-            print("Phase 2 output missing 'sections' block.", file=sys.stderr)
-            return 1
+    split = split_phase2_output(phase2_obj)
+    if split is None:
+        print("Phase 2 output missing 'sections' block.", file=sys.stderr)
+        return 1
+    sections, render_hints = split
+    shape_errors = phase2_shape_errors(sections)
+    if shape_errors:
+        print(f"Phase 2 output has malformed sections: {'; '.join(shape_errors)}", file=sys.stderr)
+        return 1
+    if checkpoint and "report_text" not in checkpoint:
+        # Only a reply that parsed and passed the shape check is worth resuming from.
+        checkpoint["report_text"] = report_text
+        write_checkpoint(checkpoint_path, checkpoint)
 
     expanded_payload = expand_compact_payload(compact_payload)
     source_summary = build_source_summary(expanded_payload)
@@ -1303,7 +1727,7 @@ def run(
         else:
             print("  No interactive edits made.", flush=True)
 
-    report_json.write_text(json.dumps(report_obj, separators=(",", ":")), encoding="utf-8")
+    report_json.write_text(_COMPACT_ENCODER.encode(report_obj), encoding="utf-8")
     print(f"  Report JSON written: {report_json}", flush=True)
 
     # ── Phase 2.5: render outputs ─────────────────────────────────────────────
@@ -1322,6 +1746,10 @@ def run(
             print(result_render.stderr.strip(), file=sys.stderr)
         print("Phase 2.5 render failed.", file=sys.stderr)
         return 1
+    try:
+        checkpoint_path.unlink(missing_ok=True)
+    except OSError:
+        pass
     for fmt in output_formats:
         out_path = output_dir / f"{base_name}.{fmt}"
         if out_path.exists():
@@ -42,6 +42,10 @@ SYNC_SKIP_FILES = {
     ".env",
     ".phase1-cache.json",
     ".phase1-cache.tmp",
+    ".phase1-hashcache.json",
+    ".phase1-hashcache.tmp",
+    ".pipeline-checkpoint.json",
+    ".pipeline-checkpoint.tmp",
     ".dev-report-cache.md",
 }
 SYNC_SKIP_SUFFIXES = (".pyc", ".log")
@@ -43,6 +43,10 @@ RSYNC_EXCLUDES=(
   --exclude=".env"
   --exclude=".phase1-cache.json"
   --exclude=".phase1-cache.tmp"
+  --exclude=".phase1-hashcache.json"
+  --exclude=".phase1-hashcache.tmp"
+  --exclude=".pipeline-checkpoint.json"
+  --exclude=".pipeline-checkpoint.tmp"
   --exclude=".dev-report-cache.md"
   --exclude="*.log"
   --exclude="*.pyc"
@@ -134,6 +138,10 @@ DIFF_EXCLUDES=(
   --exclude=".env"
   --exclude=".phase1-cache.json"
   --exclude=".phase1-cache.tmp"
+  --exclude=".phase1-hashcache.json"
+  --exclude=".phase1-hashcache.tmp"
+  --exclude=".pipeline-checkpoint.json"
+  --exclude=".pipeline-checkpoint.tmp"
   --exclude=".dev-report-cache.md"
   --exclude="*.log"
   --exclude="*.pyc"
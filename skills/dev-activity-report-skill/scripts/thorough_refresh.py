@@ -16,7 +16,10 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -35,8 +38,8 @@ def expand_path(value: str) -> Path:
 
 
 def parse_paths(raw: str) -> list[Path]:
-    parts = [p for p in raw.replace(",", " ").split() if p.strip()]
-    return [expand_path(p) for p in parts]
+    # split() never yields empty or padded tokens, so no strip/filter pass.
+    return [expand_path(p) for p in raw.replace(",", " ").split()]
 
 
 def load_env_file(path: Path) -> dict[str, str]:
@@ -68,6 +71,8 @@ def load_env() -> dict[str, str]:
 
 
 def unique_paths(paths: list[Path]) -> list[Path]:
+    if len(paths) < 2:
+        return paths  # nothing to dedupe; skip the realpath() lstat walk
     out: list[Path] = []
     seen: set[str] = set()
     for p in paths:
@@ -88,10 +93,14 @@ def resolve_roots(env: dict[str, str], cli_roots: list[str]) -> list[Path]:
     return [expand_path(env.get("APPS_DIR", "~/projects"))]
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; setup_env.py still accepts 3.9.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Plan:
-    delete_files: list[Path] = field(default_factory=list)
-    touch_files: list[Path] = field(default_factory=list)
+    delete_files: set[Path] = field(default_factory=set)
+    touch_files: set[Path] = field(default_factory=set)
     stats: dict[str, int] = field(
         default_factory=lambda: {
             "cache_files": 0,
@@ -102,32 +111,112 @@ class Plan:
         }
     )
 
-    def add_delete(self, path: Path, stat_key: str | None = None) -> None:
-        if path.exists() and path not in self.delete_files:
-            self.delete_files.append(path)
+    def _record(self, target: set[Path], path: Path, stat_key: str | None) -> None:
+        if path not in target:
+            target.add(path)
             if stat_key:
                 self.stats[stat_key] += 1
 
+    def add_delete(self, path: Path, stat_key: str | None = None) -> None:
+        if path.exists():
+            self._record(self.delete_files, path, stat_key)
+
     def add_touch(self, path: Path, stat_key: str | None = None) -> None:
-        if not path.exists() and path not in self.touch_files:
-            self.touch_files.append(path)
-            if stat_key:
-                self.stats[stat_key] += 1
+        if not path.exists():
+            self._record(self.touch_files, path, stat_key)
+
+    def add_actions(self, actions: list[tuple[str, Path, str]]) -> None:
+        """Record pre-checked (kind, path, stat_key) actions; kind is "touch" or "delete"."""
+        record, touch_files, delete_files = self._record, self.touch_files, self.delete_files
+        for kind, path, stat_key in actions:
+            record(touch_files if kind == "touch" else delete_files, path, stat_key)
+
+
+SKILL_CACHE_NAMES = frozenset({
+    ".phase1-cache.json",
+    ".phase1-cache.tmp",
+    ".phase1-hashcache.json",
+    ".phase1-hashcache.tmp",
+    ".dev-report-cache.md",
+    ".pipeline-checkpoint.json",
+    ".pipeline-checkpoint.tmp",
+})
+
+
+def list_names(folder: Path) -> set[str]:
+    """Entry names in folder from a single scandir (empty if it cannot be listed)."""
+    try:
+        with os.scandir(folder) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
 
 
 def collect_skill_cache_targets(plan: Plan, skill_root: Path) -> None:
-    for name in (".phase1-cache.json", ".phase1-cache.tmp", ".dev-report-cache.md"):
-        for folder in (skill_root, skill_root / "scripts"):
-            plan.add_delete(folder / name, "cache_files")
+    # One listing per folder instead of a stat per candidate name; the listing
+    # already proves existence, so hits skip add_delete's exists() re-check.
+    for folder in (skill_root, skill_root / "scripts"):
+        plan.add_actions([
+            ("delete", folder / name, "cache_files")
+            for name in sorted(list_names(folder) & SKILL_CACHE_NAMES)
+        ])
 
 
 def collect_root_cache_targets(plan: Plan, root: Path) -> None:
-    if not root.exists():
+    # Same scandir walk as root_marker_actions: no Path per entry, and a
+    # Path is built only for caches that exist.
+    try:
+        with os.scandir(root) as it:
+            projects = sorted(entry.name for entry in it if entry.is_dir())
+    except OSError:
         return
-    for project in sorted(root.iterdir()):
-        if not project.is_dir():
-            continue
-        plan.add_delete(project / ".dev-report-cache.md", "cache_files")
+    exists = os.path.exists
+    plan.add_actions([
+        ("delete", root / name / ".dev-report-cache.md", "cache_files")
+        for name in projects
+        if exists(os.path.join(root, name, ".dev-report-cache.md"))
+    ])
+
+
+def root_marker_actions(
+    root: Path,
+    clear_skip: bool,
+    clear_not_my_work_all: bool,
+    clear_not_my_work_forked: bool,
+) -> list[tuple[str, Path, str]]:
+    """Marker actions for the projects directly under one root.
+
+    Existence preconditions are checked here and nothing is mutated, so
+    roots can be scanned concurrently and merged with Plan.add_actions().
+    """
+    actions: list[tuple[str, Path, str]] = []
+    try:
+        with os.scandir(root) as it:
+            # DirEntry.is_dir() answers from d_type for plain dirs (no stat).
+            projects = sorted(entry.name for entry in it if entry.is_dir())
+    except OSError:
+        return actions
+    # Marker probes are plain-str stats, and each only when its flag needs it;
+    # cheaper than listing project dirs, which often hold dozens of entries.
+    exists = os.path.exists
+    for name in projects:
+        base = os.path.join(root, name, "")
+        has_forked = exists(base + ".forked-work")
+        has_forked_mod = exists(base + ".forked-work-modified")
+
+        if has_forked and not has_forked_mod:
+            actions.append(("touch", root / name / ".forked-work-modified", "promote_forked"))
+
+        if clear_not_my_work_all:
+            if exists(base + ".not-my-work"):
+                actions.append(("delete", root / name / ".not-my-work", "clear_not_my_work_all"))
+        elif clear_not_my_work_forked and (has_forked or has_forked_mod):
+            if exists(base + ".not-my-work"):
+                actions.append(("delete", root / name / ".not-my-work", "clear_not_my_work_forked"))
+
+        if clear_skip and exists(base + ".skip-for-now"):
+            actions.append(("delete", root / name / ".skip-for-now", "clear_skip"))
+    return actions
 
 
 def collect_marker_actions(
@@ -137,27 +226,21 @@ def collect_marker_actions(
     clear_not_my_work_all: bool,
     clear_not_my_work_forked: bool,
 ) -> None:
-    for root in roots:
-        if not root.exists():
-            continue
-        for project in sorted(root.iterdir()):
-            if not project.is_dir():
-                continue
-            forked = project / ".forked-work"
-            forked_mod = project / ".forked-work-modified"
-            not_mine = project / ".not-my-work"
-            skip = project / ".skip-for-now"
-
-            if forked.exists() and not forked_mod.exists():
-                plan.add_touch(forked_mod, "promote_forked")
-
-            if clear_not_my_work_all:
-                plan.add_delete(not_mine, "clear_not_my_work_all")
-            elif clear_not_my_work_forked and (forked.exists() or forked_mod.exists()):
-                plan.add_delete(not_mine, "clear_not_my_work_forked")
-
-            if clear_skip:
-                plan.add_delete(skip, "clear_skip")
+    scan = functools.partial(
+        root_marker_actions,
+        clear_skip=clear_skip,
+        clear_not_my_work_all=clear_not_my_work_all,
+        clear_not_my_work_forked=clear_not_my_work_forked,
+    )
+    if len(roots) > 1:
+        # Roots are independent metadata walks; overlap their I/O latency.
+        with ThreadPoolExecutor(max_workers=min(8, len(roots))) as pool:
+            per_root = list(pool.map(scan, roots))
+    else:
+        per_root = [scan(root) for root in roots]
+    # Merge in root order so dedupe and stats match a serial scan.
+    for actions in per_root:
+        plan.add_actions(actions)
 
 
 def apply_plan(plan: Plan, confirm: bool) -> None:
@@ -0,0 +1 @@
+"""Test package for dev-activity-report."""
@@ -7,16 +7,157 @@ Strategy: Mock all LLM calls, use tmp_path fixtures, test contracts not implemen
 Run: pytest tests/ -v
 """
 
+import collections
+import functools
+import json
 import sys
 from pathlib import Path
+from subprocess import CompletedProcess
+
+import pytest
+
+from .fixtures import valid_phase1_output, valid_phase2_output
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "skills" / "dev-activity-report-skill" / "scripts"
 
 # Add scripts to path for imports
-sys.path.insert(
-    0,
-    str(
-        Path(__file__).parent.parent
-        / "skills"
-        / "dev-activity-report-skill"
-        / "scripts"
-    ),
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+# Pre-encoded .env body; filled with the test's tmp_path (as bytes) 4 times.
+_ENV_TEMPLATE = (
+    b"APPS_DIR=%s/apps\n"
+    b"CODEX_HOME=%s/codex\n"
+    b"CLAUDE_HOME=%s/claude\n"
+    b"REPORT_OUTPUT_DIR=%s/output\n"
 )
+_PHASE15_STDOUT = json.dumps({"draft": "test", "usage": {}})
+
+_DISPATCH_SCRIPTS = frozenset({"phase1_runner.py", "phase1_5_draft.py", "render_report.py"})
+
+
+@functools.lru_cache(maxsize=8)
+def _classify(argv):
+    """Return the pipeline script invoked by `argv` (a tuple of str), if any."""
+    for arg in argv:
+        name = arg.rsplit("/", 1)[-1]
+        if name in _DISPATCH_SCRIPTS:
+            return name
+    return None
+
+
+@pytest.fixture(autouse=True)
+def reset_hash_caches():
+    """Clear phase1_runner's module-global hash caches so no test sees another's entries."""
+    import phase1_runner
+
+    phase1_runner._HASH_META.clear()
+    phase1_runner._HASH_META_SEEN.clear()
+    phase1_runner._HASH_MEMO.clear()
+
+
+@pytest.fixture(scope="session")
+def phase1_stdout():
+    """Successful Phase 1 runner envelope, serialized once per session."""
+    return json.dumps({"fp": "abc123", "cache_hit": False, "data": valid_phase1_output()})
+
+
+@pytest.fixture(scope="session")
+def phase2_reply():
+    """Valid Phase 2 model reply (sections JSON), serialized once per session."""
+    return json.dumps(valid_phase2_output()["sections"])
+
+
+@pytest.fixture(scope="session")
+def run_report_sh():
+    """run_report.sh source, read once per session and anchored to the repo
+    (not the working directory) for the shell-contract tests."""
+    return (SCRIPTS_DIR / "run_report.sh").read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def pipeline_env_file(tmp_path, monkeypatch):
+    """Write a .env under tmp_path, create its dirs and point run_pipeline at it."""
+    env_file = tmp_path / ".env"
+    p = str(tmp_path).encode()
+    env_file.write_bytes(_ENV_TEMPLATE % (p, p, p, p))
+    for name in ("apps", "codex", "claude", "output"):
+        (tmp_path / name).mkdir()
+
+    monkeypatch.setattr("run_pipeline.ENV_FILE", env_file)
+    monkeypatch.setattr("run_pipeline.SKILL_DIR", tmp_path)
+    monkeypatch.setattr("run_pipeline.find_claude_bin", lambda: "/usr/bin/claude")
+    return env_file
+
+
+@pytest.fixture
+def fake_runner(monkeypatch):
+    """
+    Replace subprocess.run with one fake keyed on the invoked pipeline script.
+
+    Returns the test's scenario, which tests edit in place:
+      outcomes       - script name -> (returncode, stdout, stderr); unlisted
+                       commands succeed with empty output
+      render_outputs - paths touched when render_report.py succeeds
+      calls          - script name -> invocation count
+    """
+    scenario = {"outcomes": {}, "render_outputs": (), "calls": collections.Counter()}
+
+    def fake_run(args, *_, **__):
+        kind = _classify(tuple(map(str, args)))
+        if kind is None:
+            return CompletedProcess(args, 0, "", "")
+        scenario["calls"][kind] += 1
+        outcome = scenario["outcomes"].get(kind, (0, "", ""))
+        if kind == "render_report.py" and outcome[0] == 0:
+            for path in scenario["render_outputs"]:
+                path.touch()
+        return CompletedProcess(args, *outcome)
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    return scenario
+
+
+@pytest.fixture
+def mock_phase1_success(fake_runner, phase1_stdout):
+    """
+    Fake runner with successful Phase 1 and Phase 1.5 outcomes.
+
+    Returns the outcome map (script name -> (returncode, stdout, stderr));
+    tests override entries to simulate a failing phase.
+    """
+    outcomes = fake_runner["outcomes"]
+    outcomes["phase1_runner.py"] = (0, phase1_stdout, "")
+    outcomes["phase1_5_draft.py"] = (0, _PHASE15_STDOUT, "")
+    return outcomes
+
+
+@pytest.fixture
+def mock_claude_success(monkeypatch, phase2_reply):
+    """Stub run_pipeline.claude_call with a valid Phase 2 reply.
+
+    Returns a one-item list holding the reply text so tests can swap it.
+    """
+    reply = [phase2_reply]
+    monkeypatch.setattr(
+        "run_pipeline.claude_call", lambda *_, **__: (reply[0], {"prompt_tokens": 100})
+    )
+    return reply
+
+
+def _record_call(log, prompt, *_, **__):
+    log.append(prompt)
+    return "{}", {"prompt_tokens": 0, "completion_tokens": 0}
+
+
+@pytest.fixture
+def patched_calls(monkeypatch):
+    """Record claude/codex model calls instead of running the CLIs.
+
+    Returns {"claude": [prompts], "codex": [prompts]}; every call replies "{}".
+    Insights quote extraction is stubbed to return nothing.
+    """
+    calls = {"claude": [], "codex": []}
+    monkeypatch.setattr("run_pipeline.claude_call", functools.partial(_record_call, calls["claude"]))
+    monkeypatch.setattr("run_pipeline.codex_exec_call", functools.partial(_record_call, calls["codex"]))
+    monkeypatch.setattr("run_pipeline.extract_insights_quote_entries", lambda *_, **__: ([], ""))
+    return calls
@@ -16,6 +16,16 @@ def load_schema(schema_name: str) -> dict:
     return json.loads(schema_path.read_text())
 
 
+def load_phase1_snapshot(name: str) -> str:
+    """
+    Return a recorded Phase 1 stdout line from `phase1_<name>.json`.
+
+    Snapshots hold the full runner envelope (`fp`, `cache_hit`, `data`) as a
+    single JSON line, matching what run_pipeline.py parses from stdout.
+    """
+    return (Path(__file__).parent / f"phase1_{name}.json").read_text().strip()
+
+
 def valid_phase1_output(**overrides: Any) -> dict:
     """
     Return a minimal valid Phase 1 output.
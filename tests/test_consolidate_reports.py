@@ -26,8 +26,9 @@ def test_merge_json_reports_dedupes_and_keeps_insights(tmp_path):
             "quotes": [{"quote": "Great work", "source_path": "/tmp/report.html", "source_link": "file:///tmp/report.html"}],
         },
     }
-    r1.write_text(json.dumps(payload), encoding="utf-8")
-    r2.write_text(json.dumps(payload), encoding="utf-8")
+    body = json.dumps(payload)
+    r1.write_text(body, encoding="utf-8")
+    r2.write_text(body, encoding="utf-8")
 
     merged = merge_json_reports([r1, r2], "Aggregate")
     assert merged["schema_version"] == "dev-activity-report.v1"
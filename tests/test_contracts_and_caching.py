@@ -6,13 +6,10 @@ These tests ensure data contracts between pipeline phases are maintained.
 """
 
 import json
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent / "fixtures"))
-from fixtures import valid_phase1_output, valid_phase2_output, load_schema
+from .fixtures import valid_phase1_output, valid_phase2_output, load_schema, load_phase1_snapshot
 
 
 class TestPhase1OutputContract:
@@ -37,6 +34,18 @@ class TestPhase1OutputContract:
         # Should not raise
         validate(instance=data, schema=schema)
     
+    def test_recorded_snapshots_pass_validation(self):
+        """Recorded Phase 1 snapshots used by pipeline tests stay schema-valid."""
+        try:
+            from jsonschema import validate
+        except ImportError:
+            pytest.skip("jsonschema not installed")
+
+        schema = load_schema("phase1_output")
+        for name in ("happy", "cached", "mixed", "markers", "empty"):
+            envelope = json.loads(load_phase1_snapshot(name))
+            validate(instance=envelope["data"], schema=schema)
+    
     def test_missing_required_fields_fails(self):
         """Missing required keys fails validation."""
         try:
@@ -130,6 +139,14 @@ class TestPhase2OutputContract:
         with pytest.raises(ValidationError):
             validate(instance=data, schema=schema)
 
+    def test_section_keys_match_schema_required(self):
+        """run_pipeline's bare-sections detection keys equal the schema's required sections."""
+        from run_pipeline import PHASE2_SECTION_KEYS
+
+        schema = load_schema("phase2_output")
+        assert PHASE2_SECTION_KEYS == frozenset(schema["properties"]["sections"]["required"])
+        assert PHASE2_SECTION_KEYS <= valid_phase2_output()["sections"].keys()
+
 
 class TestFingerprintStability:
     """Content-based fingerprinting must be stable."""
@@ -173,6 +190,131 @@ class TestFingerprintStability:
         
         assert fp1 == fp2
 
+    def test_large_file_hashes_full_content(self, tmp_path):
+        """Streamed files over STREAM_CHUNK see a same-size edit at any offset."""
+        import phase1_runner
+        from phase1_runner import STREAM_CHUNK, hash_file
+
+        test_file = tmp_path / "data.json"
+        data = bytearray(STREAM_CHUNK * 3 + 300_000)
+        test_file.write_bytes(data)
+        fp1 = hash_file(test_file)
+        assert len(fp1) == 64
+
+        for offset in (100_000, STREAM_CHUNK - 2, STREAM_CHUNK + 100_000, len(data) - 100_000):
+            edited = bytearray(data)
+            edited[offset : offset + 5] = b"edit!"
+            test_file.write_bytes(edited)
+            phase1_runner._HASH_MEMO.clear()  # same size; don't rely on mtime_ns granularity
+            assert hash_file(test_file) != fp1, offset
+
+    def test_parallel_hashing_matches_serial(self, tmp_path, monkeypatch):
+        """Thread-pooled directory hashing is order-stable and equals the serial result."""
+        import phase1_runner
+
+        for i in range(phase1_runner.PARALLEL_HASH_MIN_FILES + 4):
+            (tmp_path / f"m{i:02d}.py").write_text(f"x = {i}")
+
+        monkeypatch.setattr(phase1_runner, "HASH_WORKERS", 1)
+        serial = phase1_runner.hash_non_git_dir(tmp_path, {".py"})
+        phase1_runner._HASH_META.clear()
+        monkeypatch.setattr(phase1_runner, "HASH_WORKERS", 4)
+        assert phase1_runner.hash_non_git_dir(tmp_path, {".py"}) == serial
+
+    def test_walker_prunes_ignored_hidden_and_deep_dirs(self, tmp_path):
+        """Files under IGNORED_DIRS, dot-dirs or beyond max_depth never reach the hash."""
+        from phase1_runner import hash_non_git_dir
+
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "a" / "b" / "keep.py").write_text("x = 1")
+        fp = hash_non_git_dir(tmp_path, {".py"}, max_depth=2)
+
+        for noise in ("node_modules/dep.py", ".venv/site.py", "a/b/c/deep.py"):
+            (tmp_path / noise).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / noise).write_text("noise")
+        assert hash_non_git_dir(tmp_path, {".py"}, max_depth=2) == fp
+
+    def test_ignore_matcher_rules(self):
+        """Compiled ignore globs keep full-path, filename and 'dir/*' prefix semantics."""
+        from phase1_runner import _ignore_matcher
+
+        ignored = _ignore_matcher(("*.log", "build/*", "docs/*.tmp"))
+        assert ignored("deep/nested/run.log")
+        assert ignored("build") and ignored("build/a/b.py")
+        assert ignored("docs/x.tmp")
+        assert not ignored("builder/a.py")
+        assert not ignored("src/main.py")
+        assert not _ignore_matcher(())("anything.log")
+
+    def test_extension_filter_case_insensitive(self, tmp_path):
+        """Allowed extensions match regardless of case; look-alike suffixes do not."""
+        from phase1_runner import hash_non_git_dir
+
+        (tmp_path / "Main.PY").write_text("x = 1")
+        fp = hash_non_git_dir(tmp_path, {".py"})
+        (tmp_path / "main.pyc").write_bytes(b"\x00")
+        assert hash_non_git_dir(tmp_path, {".py"}) == fp
+        (tmp_path / "Main.PY").write_text("x = 2")
+        assert hash_non_git_dir(tmp_path, {".py"}) != fp
+
+    def test_hash_bytes_matches_hash_file(self, tmp_path):
+        """In-memory hashing agrees with the disk path for small and streamed sizes."""
+        from phase1_runner import STREAM_CHUNK, hash_bytes, hash_file
+
+        for name, data in (("small.py", b"print('x')"), ("big.bin", bytes(range(256)) * (STREAM_CHUNK // 128 + 3))):
+            test_file = tmp_path / name
+            test_file.write_bytes(data)
+            assert hash_bytes(data) == hash_file(test_file)
+            assert hash_bytes(memoryview(data)) == hash_file(test_file)
+
+    def test_hash_memo_reuses_until_metadata_changes(self, tmp_path, monkeypatch):
+        """hash_file memoizes on (path, mtime_ns, size); a touch forces a re-read."""
+        import os
+        import phase1_runner
+
+        test_file = tmp_path / "memo.py"
+        test_file.write_text("print('memo')")
+        reads = []
+        real_hash_bytes = phase1_runner.hash_bytes
+        monkeypatch.setattr(phase1_runner, "hash_bytes", lambda buf: reads.append(buf) or real_hash_bytes(buf))
+
+        fp = phase1_runner.hash_file(test_file)
+        assert phase1_runner.hash_file(test_file) == fp
+        assert len(reads) == 1
+
+        os.utime(test_file, ns=(1, 1))
+        assert phase1_runner.hash_file(test_file) == fp
+        assert len(reads) == 2
+
+    def test_path_content_boundary_unambiguous(self, tmp_path):
+        """Shifting bytes between a path and its content changes the rollup."""
+        from phase1_runner import hash_paths
+
+        one, two = tmp_path / "one", tmp_path / "two"
+        one.mkdir()
+        two.mkdir()
+        (one / "a.py").write_text("xyz")
+        (two / "a.pyx").write_text("yz")
+        assert hash_paths(one, ["a.py"]) != hash_paths(two, ["a.pyx"])
+
+    def test_non_regular_files_hash_empty(self, tmp_path):
+        """Directories and FIFOs are not read (a FIFO would otherwise block)."""
+        import os
+        from phase1_runner import hash_file
+
+        assert hash_file(tmp_path) == ""
+        if not hasattr(os, "mkfifo"):
+            pytest.skip("mkfifo not available")
+        fifo = tmp_path / "pipe.py"
+        os.mkfifo(fifo)
+        assert hash_file(fifo) == ""
+
+    def test_hash_backend_reported(self):
+        """--hash-info names the active backend (blake3 or OpenSSL sha256)."""
+        from phase1_runner import hash_backend
+
+        assert hash_backend().startswith(("blake3", "sha256"))
+
 
 class TestCacheBehavior:
     """Cache hit/miss logic."""
@@ -221,6 +363,74 @@ class TestCacheBehavior:
         cache = read_cache()
         assert cache is None  # Graceful fallback
 
+    def test_hash_meta_cache_skips_unchanged_files(self, tmp_path, monkeypatch):
+        """Warm rescans reuse persisted hashes while mtime and size match."""
+        import os
+        import phase1_runner
+
+        monkeypatch.setattr(phase1_runner, "HASH_CACHE_FILE", tmp_path / ".phase1-hashcache.json")
+        project = tmp_path / "proj"
+        project.mkdir()
+        (project / "a.py").write_text("print('a')")
+        (project / "b.py").write_text("print('b')")
+
+        phase1_runner.read_hash_cache()
+        fp1 = phase1_runner.hash_non_git_dir(project, {".py"})
+        phase1_runner.write_hash_cache()
+
+        phase1_runner.read_hash_cache()  # fresh process: reload from disk
+        calls = []
+        real_hash_file = phase1_runner.hash_file
+        monkeypatch.setattr(
+            phase1_runner, "hash_file", lambda p, st=None: calls.append(p) or real_hash_file(p, st)
+        )
+        assert phase1_runner.hash_non_git_dir(project, {".py"}) == fp1
+        assert calls == []
+
+        (project / "b.py").write_text("print('changed')")
+        assert phase1_runner.hash_non_git_dir(project, {".py"}) != fp1
+        assert [os.path.basename(p) for p in calls] == ["b.py"]
+
+    def test_project_pool_matches_serial_and_returns_meta(self, tmp_path, monkeypatch):
+        """Fanned-out project fingerprints equal the in-process ones; meta entries reach the parent."""
+        import phase1_runner
+
+        for i in range(phase1_runner.PARALLEL_PROJECTS_MIN + 1):
+            (tmp_path / f"p{i}").mkdir()
+            (tmp_path / f"p{i}" / "main.py").write_text(f"x = {i}")
+
+        monkeypatch.setattr(phase1_runner, "PROJECT_WORKERS", 1)
+        serial = phase1_runner.collect_projects(tmp_path, {}, {".py"})
+        phase1_runner._HASH_META.clear()
+        phase1_runner._HASH_MEMO.clear()
+
+        monkeypatch.setattr(phase1_runner, "PROJECT_WORKERS", 2)
+        pooled = phase1_runner.collect_projects(tmp_path, {}, {".py"})
+        assert [p["fp"] for p in pooled] == [p["fp"] for p in serial]
+        assert str(tmp_path / "p0" / "main.py") in phase1_runner._HASH_META
+
+    def test_spawned_project_pool_uses_loaded_meta(self, tmp_path, monkeypatch):
+        """Spawned workers start empty, so the parent's loaded meta-cache must be handed over."""
+        import multiprocessing
+        import phase1_runner
+
+        for i in range(phase1_runner.PARALLEL_PROJECTS_MIN):
+            (tmp_path / f"p{i}").mkdir()
+            (tmp_path / f"p{i}" / "main.py").write_text(f"x = {i}")
+        main_py = tmp_path / "p0" / "main.py"
+        st = main_py.stat()
+        # A stale-looking digest only a worker reading the handed-over cache would return.
+        phase1_runner._HASH_META[str(main_py)] = [st.st_mtime_ns, st.st_size, "0" * 32]
+
+        monkeypatch.setattr(phase1_runner, "PROJECT_WORKERS", 1)
+        serial = phase1_runner.collect_projects(tmp_path, {}, {".py"})
+        phase1_runner._HASH_MEMO.clear()
+
+        monkeypatch.setattr(phase1_runner, "PROJECT_WORKERS", 2)
+        monkeypatch.setattr(phase1_runner, "_POOL_CONTEXT", multiprocessing.get_context("spawn"))
+        pooled = phase1_runner.collect_projects(tmp_path, {}, {".py"})
+        assert [p["fp"] for p in pooled] == [p["fp"] for p in serial]
+
 
 class TestPerProjectCacheFiles:
     """Per-project .dev-report-cache.md write/read round-trip."""
@@ -5,27 +5,69 @@ Tests data flow: Phase 1 -> Phase 1.5 -> Phase 2 -> Render
 All LLM calls are mocked. Tests verify contracts between phases.
 
 Strategy:
-- Mock at subprocess level (subprocess.run)
+- Mock at subprocess level via one shared fake runner (subprocess.run)
 - Use shared fixtures for valid data
 - Validate outputs against JSON schemas
 - Test both happy paths and error conditions
 """
 
 import json
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent / "fixtures"))
-from fixtures import valid_phase1_output, valid_phase15_output, valid_phase2_output
+from .fixtures import load_phase1_snapshot, valid_phase15_output
+
+# Recorded Phase 1 envelopes ({"fp", "cache_hit", "data"}), loaded once.
+_PHASE1_HAPPY = load_phase1_snapshot("happy")
+_PHASE1_CACHED = load_phase1_snapshot("cached")
+_PHASE1_MIXED = load_phase1_snapshot("mixed")
+_PHASE1_MARKERS = load_phase1_snapshot("markers")
+_PHASE1_EMPTY = load_phase1_snapshot("empty")
+
+_PHASE15_STDOUT = json.dumps(valid_phase15_output())
+# Empty-run replies (no projects), serialized once.
+_PHASE15_EMPTY_STDOUT = json.dumps({"draft": "No projects to report on.", "usage": {}})
+_PHASE2_EMPTY_JSON = json.dumps(
+    {
+        "sections": {
+            "overview": {"bullets": []},
+            "key_changes": [],
+            "recommendations": [],
+            "resume_bullets": [],
+            "linkedin": {"sentences": []},
+            "highlights": [],
+            "timeline": [],
+            "tech_inventory": {},
+        }
+    }
+)
+
+
+def use_scenario(
+    scenario,
+    tmp_path,
+    phase1_stdout,
+    phase15_stdout=_PHASE15_STDOUT,
+    render_outputs=("dev-activity-report.md",),
+):
+    """Point the shared fake runner (conftest `fake_runner`) at this test's phase outputs."""
+    scenario["outcomes"].update(
+        {
+            "phase1_runner.py": (0, phase1_stdout, ""),
+            "phase1_5_draft.py": (0, phase15_stdout, ""),
+        }
+    )
+    scenario["render_outputs"] = tuple(tmp_path / "output" / name for name in render_outputs)
+    return scenario
 
 
+@pytest.mark.integration
+@pytest.mark.usefixtures("pipeline_env_file")
 class TestFullPipeline:
     """End-to-end pipeline with all phases executing."""
 
-    def test_happy_path_produces_output_files(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("mock_claude_success")
+    def test_happy_path_produces_output_files(self, tmp_path, pipeline_env_file, fake_runner):
         """
         Full pipeline with valid inputs produces .md and .html files.
 
@@ -34,82 +76,15 @@ class TestFullPipeline:
         """
         from run_pipeline import run
 
-        # Setup environment
-        env_file = tmp_path / ".env"
-        env_file.write_text(f"""
-APPS_DIR={tmp_path}/apps
-CODEX_HOME={tmp_path}/codex
-CLAUDE_HOME={tmp_path}/claude
-REPORT_OUTPUT_DIR={tmp_path}/output
-REPORT_OUTPUT_FORMATS=md,html
-""")
-
-        # Create required directories
-        (tmp_path / "apps").mkdir()
-        (tmp_path / "codex").mkdir()
-        (tmp_path / "claude").mkdir()
-        (tmp_path / "output").mkdir()
-
-        # Create test project
-        project_dir = tmp_path / "apps" / "test-project"
-        project_dir.mkdir(parents=True)
-        (project_dir / ".git").mkdir()
-        (project_dir / "main.py").write_text("print('hello')")
-
-        monkeypatch.setattr("run_pipeline.ENV_FILE", env_file)
-        monkeypatch.setattr("run_pipeline.SKILL_DIR", tmp_path)
-        monkeypatch.setattr("run_pipeline.find_claude_bin", lambda: "/usr/bin/claude")
-
-        # Track subprocess calls
-        phase1_data = valid_phase1_output(
-            ad=str(tmp_path / "apps"),
-            p=[
-                {
-                    "n": "test-project",
-                    "pt": str(project_dir),
-                    "fp": "a" * 64,
-                    "st": "orig",
-                    "cc": 5,
-                    "sd": "1 file changed",
-                    "fc": ["main.py"],
-                    "msg": ["Initial commit"],
-                    "hl": ["feature"],
-                    "rt": str(tmp_path / "apps"),
-                }
-            ],
-        )
-
-        def mock_subprocess_run(*args, **kwargs):
-            cmd_str = " ".join(str(a) for a in args[0])
-
-            if "phase1_runner.py" in cmd_str:
-                return MagicMock(
-                    returncode=0,
-                    stdout=json.dumps(
-                        {"fp": "abc123", "cache_hit": False, "data": phase1_data}
-                    ),
-                    stderr="",
-                )
-            elif "phase1_5_draft.py" in cmd_str:
-                return MagicMock(
-                    returncode=0, stdout=json.dumps(valid_phase15_output()), stderr=""
-                )
-            elif "render_report.py" in cmd_str:
-                # Create output files to simulate successful render
-                output_dir = tmp_path / "output"
-                (output_dir / "dev-activity-report.md").write_text("# Test Report")
-                (output_dir / "dev-activity-report.html").write_text(
-                    "<html>Test</html>"
-                )
-                return MagicMock(returncode=0, stdout="", stderr="")
-
-            return MagicMock(returncode=0, stdout="", stderr="")
-
-        def mock_claude_call(*args, **kwargs):
-            return json.dumps(valid_phase2_output()["sections"]), {"prompt_tokens": 100}
+        with pipeline_env_file.open("ab") as fh:
+            fh.write(b"REPORT_OUTPUT_FORMATS=md,html\n")
 
-        monkeypatch.setattr("subprocess.run", mock_subprocess_run)
-        monkeypatch.setattr("run_pipeline.claude_call", mock_claude_call)
+        use_scenario(
+            fake_runner,
+            tmp_path,
+            _PHASE1_HAPPY,
+            render_outputs=("dev-activity-report.md", "dev-activity-report.html"),
+        )
 
         # Execute
         result = run(foreground=True)
@@ -118,7 +93,8 @@ REPORT_OUTPUT_FORMATS=md,html
         assert result == 0
         assert (tmp_path / "output" / "dev-activity-report.md").exists()
 
-    def test_cached_projects_still_generate_report(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("mock_claude_success")
+    def test_cached_projects_still_generate_report(self, tmp_path, fake_runner):
         """
         Cache hits still generate a report through all phases.
 
@@ -128,162 +104,41 @@ REPORT_OUTPUT_FORMATS=md,html
         """
         from run_pipeline import run
 
-        env_file = tmp_path / ".env"
-        env_file.write_text(f"""
-APPS_DIR={tmp_path}/apps
-CODEX_HOME={tmp_path}/codex
-CLAUDE_HOME={tmp_path}/claude
-REPORT_OUTPUT_DIR={tmp_path}/output
-""")
-
-        (tmp_path / "apps").mkdir()
-        (tmp_path / "codex").mkdir()
-        (tmp_path / "claude").mkdir()
-        (tmp_path / "output").mkdir()
-
-        monkeypatch.setattr("run_pipeline.ENV_FILE", env_file)
-        monkeypatch.setattr("run_pipeline.SKILL_DIR", tmp_path)
-        monkeypatch.setattr("run_pipeline.find_claude_bin", lambda: "/usr/bin/claude")
-
-        # All projects cached - still includes data for report generation
-        phase1_data = valid_phase1_output(
-            stats={"total": 1, "stale": 0, "cached": 1},
-            p=[
-                {
-                    "n": "cached-project",
-                    "pt": str(tmp_path / "apps" / "cached-project"),
-                    "fp": "a" * 64,
-                    "st": "orig",
-                    "cc": 0,
-                    "sd": "0 files changed",
-                    "fc": [],
-                    "msg": [],
-                    "hl": [],
-                    "rt": str(tmp_path / "apps"),
-                }
-            ],
-        )
-
-        def mock_subprocess_run(*args, **kwargs):
-            cmd_str = " ".join(str(a) for a in args[0])
-
-            if "phase1_runner.py" in cmd_str:
-                return MagicMock(
-                    returncode=0,
-                    stdout=json.dumps(
-                        {"fp": "abc123", "cache_hit": True, "data": phase1_data}
-                    ),
-                    stderr="",
-                )
-            elif "phase1_5_draft.py" in cmd_str:
-                return MagicMock(
-                    returncode=0, stdout=json.dumps(valid_phase15_output()), stderr=""
-                )
-            elif "render_report.py" in cmd_str:
-                (tmp_path / "output" / "dev-activity-report.md").write_text(
-                    "# Cached Report"
-                )
-                return MagicMock(returncode=0, stdout="", stderr="")
-
-            return MagicMock(returncode=0, stdout="", stderr="")
-
-        def mock_claude_call(*args, **kwargs):
-            return json.dumps(valid_phase2_output()["sections"]), {"prompt_tokens": 100}
-
-        monkeypatch.setattr("subprocess.run", mock_subprocess_run)
-        monkeypatch.setattr("run_pipeline.claude_call", mock_claude_call)
+        use_scenario(fake_runner, tmp_path, _PHASE1_CACHED)
 
         result = run(foreground=True)
 
         # Pipeline should succeed even with cached data
         assert result == 0
 
-    def test_partial_cache_mixed_stale_and_cached(self, tmp_path, monkeypatch):
+    def test_partial_cache_mixed_stale_and_cached(self, tmp_path, monkeypatch, fake_runner, mock_claude_success):
         """
         Pipeline handles mix of cached and stale projects correctly.
 
         Verifies that only stale projects trigger LLM calls while
         cached projects are skipped.
         """
-        from run_pipeline import run
-
-        env_file = tmp_path / ".env"
-        env_file.write_text(f"""
-APPS_DIR={tmp_path}/apps
-CODEX_HOME={tmp_path}/codex
-CLAUDE_HOME={tmp_path}/claude
-REPORT_OUTPUT_DIR={tmp_path}/output
-""")
-
-        (tmp_path / "apps").mkdir()
-        (tmp_path / "codex").mkdir()
-        (tmp_path / "claude").mkdir()
-        (tmp_path / "output").mkdir()
-
-        monkeypatch.setattr("run_pipeline.ENV_FILE", env_file)
-        monkeypatch.setattr("run_pipeline.SKILL_DIR", tmp_path)
-        monkeypatch.setattr("run_pipeline.find_claude_bin", lambda: "/usr/bin/claude")
-
-        # Mixed: 1 stale, 1 cached
-        phase1_data = valid_phase1_output(
-            stats={"total": 2, "stale": 1, "cached": 1},
-            p=[
-                {
-                    "n": "stale-project",
-                    "pt": str(tmp_path / "apps" / "stale-project"),
-                    "fp": "a" * 64,
-                    "st": "orig",
-                    "cc": 5,
-                    "sd": "changes",
-                    "fc": ["file.py"],
-                    "msg": ["commit"],
-                    "hl": [],
-                    "rt": str(tmp_path / "apps"),
-                }
-            ],
-        )
+        import run_pipeline
 
-        call_count = {"phase15": 0, "phase2": 0}
-
-        def mock_subprocess_run(*args, **kwargs):
-            cmd_str = " ".join(str(a) for a in args[0])
-
-            if "phase1_runner.py" in cmd_str:
-                return MagicMock(
-                    returncode=0,
-                    stdout=json.dumps(
-                        {"fp": "abc123", "cache_hit": False, "data": phase1_data}
-                    ),
-                    stderr="",
-                )
-            elif "phase1_5_draft.py" in cmd_str:
-                call_count["phase15"] += 1
-                return MagicMock(
-                    returncode=0, stdout=json.dumps(valid_phase15_output()), stderr=""
-                )
-            elif "render_report.py" in cmd_str:
-                (tmp_path / "output" / "dev-activity-report.md").write_text("# Mixed")
-                return MagicMock(returncode=0, stdout="", stderr="")
-
-            return MagicMock(returncode=0, stdout="", stderr="")
+        scenario = use_scenario(fake_runner, tmp_path, _PHASE1_MIXED)
+        call_count = scenario["calls"]
 
         def mock_claude_call(*args, **kwargs):
             call_count["phase2"] += 1
-            return json.dumps(valid_phase2_output()["sections"]), {"prompt_tokens": 100}
+            return mock_claude_success[0], {"prompt_tokens": 100}
 
-        monkeypatch.setattr("subprocess.run", mock_subprocess_run)
-        monkeypatch.setattr("run_pipeline.claude_call", mock_claude_call)
+        monkeypatch.setattr(run_pipeline, "claude_call", mock_claude_call)
 
-        result = run(foreground=True)
+        result = run_pipeline.run(foreground=True)
 
         # Should call LLM APIs for the stale project
         assert result == 0
-        assert call_count["phase15"] == 1, (
+        assert call_count["phase1_5_draft.py"] == 1, (
             "Phase 1.5 should be called for stale projects"
         )
         assert call_count["phase2"] == 1, "Phase 2 should be called for stale projects"
 
-    def test_phase1_invalid_json_fails_gracefully(self, tmp_path, monkeypatch):
+    def test_phase1_invalid_json_fails_gracefully(self, tmp_path, fake_runner):
         """
         Corrupted Phase 1 output stops pipeline with error code.
 
@@ -292,41 +147,13 @@ REPORT_OUTPUT_DIR={tmp_path}/output
         """
         from run_pipeline import run
 
-        env_file = tmp_path / ".env"
-        env_file.write_text(f"""
-APPS_DIR={tmp_path}/apps
-CODEX_HOME={tmp_path}/codex
-CLAUDE_HOME={tmp_path}/claude
-REPORT_OUTPUT_DIR={tmp_path}/output
-""")
-
-        (tmp_path / "apps").mkdir()
-        (tmp_path / "codex").mkdir()
-        (tmp_path / "claude").mkdir()
-
-        monkeypatch.setattr("run_pipeline.ENV_FILE", env_file)
-        monkeypatch.setattr("run_pipeline.SKILL_DIR", tmp_path)
-        monkeypatch.setattr("run_pipeline.find_claude_bin", lambda: "/usr/bin/claude")
-
-        def mock_subprocess_run(*args, **kwargs):
-            cmd_str = " ".join(str(a) for a in args[0])
-
-            if "phase1_runner.py" in cmd_str:
-                return MagicMock(
-                    returncode=0,
-                    stdout="not valid json {{[",  # Invalid JSON
-                    stderr="",
-                )
-
-            return MagicMock(returncode=0, stdout="", stderr="")
-
-        monkeypatch.setattr("subprocess.run", mock_subprocess_run)
+        use_scenario(fake_runner, tmp_path, "not valid json {{[")  # Invalid JSON
 
         result = run(foreground=True)
 
         assert result == 1, "Should return error code for invalid Phase 1 output"
 
-    def test_phase2_invalid_json_triggers_fallback(self, tmp_path, monkeypatch):
+    def test_phase2_invalid_json_triggers_fallback(self, tmp_path, fake_runner, mock_claude_success):
         """
         Phase 2 returning invalid JSON is handled gracefully.
 
@@ -335,55 +162,15 @@ REPORT_OUTPUT_DIR={tmp_path}/output
         """
         from run_pipeline import run
 
-        env_file = tmp_path / ".env"
-        env_file.write_text(f"""
-APPS_DIR={tmp_path}/apps
-CODEX_HOME={tmp_path}/codex
-CLAUDE_HOME={tmp_path}/claude
-REPORT_OUTPUT_DIR={tmp_path}/output
-""")
-
-        (tmp_path / "apps").mkdir()
-        (tmp_path / "codex").mkdir()
-        (tmp_path / "claude").mkdir()
-        (tmp_path / "output").mkdir()
-
-        monkeypatch.setattr("run_pipeline.ENV_FILE", env_file)
-        monkeypatch.setattr("run_pipeline.SKILL_DIR", tmp_path)
-        monkeypatch.setattr("run_pipeline.find_claude_bin", lambda: "/usr/bin/claude")
-
-        phase1_data = valid_phase1_output()
-
-        def mock_subprocess_run(*args, **kwargs):
-            cmd_str = " ".join(str(a) for a in args[0])
-
-            if "phase1_runner.py" in cmd_str:
-                return MagicMock(
-                    returncode=0,
-                    stdout=json.dumps(
-                        {"fp": "abc123", "cache_hit": False, "data": phase1_data}
-                    ),
-                    stderr="",
-                )
-            elif "phase1_5_draft.py" in cmd_str:
-                return MagicMock(
-                    returncode=0, stdout=json.dumps(valid_phase15_output()), stderr=""
-                )
-
-            return MagicMock(returncode=0, stdout="", stderr="")
-
-        def mock_claude_call(*args, **kwargs):
-            # Return invalid JSON
-            return "This is not JSON", {"prompt_tokens": 100}
-
-        monkeypatch.setattr("subprocess.run", mock_subprocess_run)
-        monkeypatch.setattr("run_pipeline.claude_call", mock_claude_call)
+        use_scenario(fake_runner, tmp_path, _PHASE1_HAPPY)
+        mock_claude_success[0] = "This is not JSON"
 
         result = run(foreground=True)
 
         assert result == 1, "Should return error code for invalid Phase 2 output"
 
-    def test_marker_files_excluded_from_report(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("mock_claude_success")
+    def test_marker_files_excluded_from_report(self, tmp_path, fake_runner):
         """
         Projects with .skip-for-now/.not-my-work markers excluded.
 
@@ -392,100 +179,46 @@ REPORT_OUTPUT_DIR={tmp_path}/output
         """
         from run_pipeline import run
 
-        env_file = tmp_path / ".env"
-        env_file.write_text(f"""
-APPS_DIR={tmp_path}/apps
-CODEX_HOME={tmp_path}/codex
-CLAUDE_HOME={tmp_path}/claude
-REPORT_OUTPUT_DIR={tmp_path}/output
-""")
+        # Phase 1 is faked, so the exclusions live in the recorded payload:
+        # two `mk` entries and only the active project in `p`.
+        use_scenario(fake_runner, tmp_path, _PHASE1_MARKERS)
 
-        apps_dir = tmp_path / "apps"
-        apps_dir.mkdir()
-        (tmp_path / "codex").mkdir()
-        (tmp_path / "claude").mkdir()
-        (tmp_path / "output").mkdir()
-
-        # Create active project
-        active_dir = apps_dir / "active-project"
-        active_dir.mkdir()
-        (active_dir / ".git").mkdir()
-
-        # Create skipped project
-        skipped_dir = apps_dir / "skipped-project"
-        skipped_dir.mkdir()
-        (skipped_dir / ".git").mkdir()
-        (skipped_dir / ".skip-for-now").touch()
-
-        # Create not-my-work project
-        not_mine_dir = apps_dir / "forked-lib"
-        not_mine_dir.mkdir()
-        (not_mine_dir / ".git").mkdir()
-        (not_mine_dir / ".not-my-work").touch()
-
-        monkeypatch.setattr("run_pipeline.ENV_FILE", env_file)
-        monkeypatch.setattr("run_pipeline.SKILL_DIR", tmp_path)
-        monkeypatch.setattr("run_pipeline.find_claude_bin", lambda: "/usr/bin/claude")
-
-        # Only active project should be in Phase 1 output
-        phase1_data = valid_phase1_output(
-            mk=[
-                {"m": ".skip-for-now", "p": "skipped-project"},
-                {"m": ".not-my-work", "p": "forked-lib"},
-            ],
-            p=[
-                {
-                    "n": "active-project",
-                    "pt": str(active_dir),
-                    "fp": "a" * 64,
-                    "st": "orig",
-                    "cc": 5,
-                    "sd": "changes",
-                    "fc": ["file.py"],
-                    "msg": ["commit"],
-                    "hl": [],
-                    "rt": str(apps_dir),
-                }
-            ],
-            stats={"total": 1, "stale": 1, "cached": 0},
-        )
+        result = run(foreground=True)
 
-        def mock_subprocess_run(*args, **kwargs):
-            cmd_str = " ".join(str(a) for a in args[0])
-
-            if "phase1_runner.py" in cmd_str:
-                return MagicMock(
-                    returncode=0,
-                    stdout=json.dumps(
-                        {"fp": "abc123", "cache_hit": False, "data": phase1_data}
-                    ),
-                    stderr="",
-                )
-            elif "phase1_5_draft.py" in cmd_str:
-                return MagicMock(
-                    returncode=0, stdout=json.dumps(valid_phase15_output()), stderr=""
-                )
-            elif "render_report.py" in cmd_str:
-                (tmp_path / "output" / "dev-activity-report.md").write_text(
-                    "# Active Project Only"
-                )
-                return MagicMock(returncode=0, stdout="", stderr="")
-
-            return MagicMock(returncode=0, stdout="", stderr="")
+        assert result == 0
+        # Verify only active project was processed (only 1 project in stats)
+        assert json.loads(_PHASE1_MARKERS)["data"]["stats"]["total"] == 1
 
-        def mock_claude_call(*args, **kwargs):
-            return json.dumps(valid_phase2_output()["sections"]), {"prompt_tokens": 100}
+    def test_empty_project_list_handled(self, tmp_path, fake_runner, mock_claude_success):
+        """
+        No projects to analyze is handled by the pipeline.
+
+        When there are no projects, Phase 2 still runs but with empty data.
+        The pipeline should handle this gracefully.
+        """
+        from run_pipeline import run
 
-        monkeypatch.setattr("subprocess.run", mock_subprocess_run)
-        monkeypatch.setattr("run_pipeline.claude_call", mock_claude_call)
+        use_scenario(
+            fake_runner,
+            tmp_path,
+            _PHASE1_EMPTY,
+            phase15_stdout=_PHASE15_EMPTY_STDOUT,
+        )
+        # Return valid empty-phase2 output
+        mock_claude_success[0] = _PHASE2_EMPTY_JSON
 
         result = run(foreground=True)
 
-        assert result == 0
-        # Verify only active project was processed (only 1 project in stats)
-        assert phase1_data["stats"]["total"] == 1
+        # Pipeline completes (may return 0 or 1 depending on implementation)
+        # Key is it doesn't crash
+        assert (tmp_path / "output" / "dev-activity-report.md").exists()
+
 
-    def test_forked_work_precedence(self, tmp_path, monkeypatch):
+@pytest.mark.unit
+class TestPureUnits:
+    """Pure-function checks that need no pipeline scaffolding."""
+
+    def test_forked_work_precedence(self, tmp_path):
         """
         .forked-work-modified takes precedence over .forked-work.
 
@@ -505,7 +238,37 @@ REPORT_OUTPUT_DIR={tmp_path}/output
 
         assert status_map.get("forked-project") == "fork_mod"
 
-    def test_configuration_override_chain(self, tmp_path, monkeypatch):
+    def test_marker_depth_bound(self, tmp_path):
+        """Markers are honoured up to depth 2 below APPS_DIR and ignored deeper."""
+        from phase1_runner import discover_markers
+
+        (tmp_path / "shallow" / "sub").mkdir(parents=True)
+        (tmp_path / "shallow" / "sub" / ".skip-for-now").touch()
+        (tmp_path / "deep" / "a" / "b").mkdir(parents=True)
+        (tmp_path / "deep" / "a" / "b" / ".not-my-work").touch()
+
+        markers, status_map = discover_markers(tmp_path)
+
+        assert status_map == {"shallow": "skip"}
+        assert [m["p"] for m in markers] == ["shallow"]
+
+    def test_marker_status_precedence_is_order_independent(self, tmp_path):
+        """Conflicting markers resolve by STATUS_PRECEDENCE, not by traversal order."""
+        from phase1_runner import discover_markers
+
+        (tmp_path / "mixed" / "vendor").mkdir(parents=True)
+        (tmp_path / "mixed" / ".forked-work-modified").touch()
+        (tmp_path / "mixed" / "vendor" / ".not-my-work").touch()
+        (tmp_path / "both").mkdir()
+        (tmp_path / "both" / ".not-my-work").touch()
+        (tmp_path / "both" / ".skip-for-now").touch()
+
+        markers, status_map = discover_markers(tmp_path)
+
+        assert status_map == {"mixed": "fork_mod", "both": "skip"}
+        assert len(markers) == 4
+
+    def test_configuration_override_chain(self, tmp_path):
         """
         CLI args -> .env -> defaults precedence verified end-to-end.
 
@@ -536,87 +299,3 @@ REPORT_OUTPUT_DIR={tmp_path}/output
         roots = resolve_scan_roots(env, cli_roots)
         assert len(roots) == 1
         assert str(roots[0]) == str(tmp_path / "cli")
-
-    def test_empty_project_list_handled(self, tmp_path, monkeypatch):
-        """
-        No projects to analyze is handled by the pipeline.
-
-        When there are no projects, Phase 2 still runs but with empty data.
-        The pipeline should handle this gracefully.
-        """
-        from run_pipeline import run
-
-        env_file = tmp_path / ".env"
-        env_file.write_text(f"""
-APPS_DIR={tmp_path}/apps
-CODEX_HOME={tmp_path}/codex
-CLAUDE_HOME={tmp_path}/claude
-REPORT_OUTPUT_DIR={tmp_path}/output
-""")
-
-        (tmp_path / "apps").mkdir()
-        (tmp_path / "codex").mkdir()
-        (tmp_path / "claude").mkdir()
-        (tmp_path / "output").mkdir()
-
-        monkeypatch.setattr("run_pipeline.ENV_FILE", env_file)
-        monkeypatch.setattr("run_pipeline.SKILL_DIR", tmp_path)
-        monkeypatch.setattr("run_pipeline.find_claude_bin", lambda: "/usr/bin/claude")
-
-        # Empty project list
-        phase1_data = valid_phase1_output(
-            p=[], stats={"total": 0, "stale": 0, "cached": 0}
-        )
-
-        def mock_subprocess_run(*args, **kwargs):
-            cmd_str = " ".join(str(a) for a in args[0])
-
-            if "phase1_runner.py" in cmd_str:
-                return MagicMock(
-                    returncode=0,
-                    stdout=json.dumps(
-                        {"fp": "abc123", "cache_hit": False, "data": phase1_data}
-                    ),
-                    stderr="",
-                )
-            elif "phase1_5_draft.py" in cmd_str:
-                return MagicMock(
-                    returncode=0,
-                    stdout=json.dumps(
-                        {"draft": "No projects to report on.", "usage": {}}
-                    ),
-                    stderr="",
-                )
-            elif "render_report.py" in cmd_str:
-                (tmp_path / "output" / "dev-activity-report.md").write_text(
-                    "# Empty Report"
-                )
-                return MagicMock(returncode=0, stdout="", stderr="")
-
-            return MagicMock(returncode=0, stdout="", stderr="")
-
-        def mock_claude_call(*args, **kwargs):
-            # Return valid empty-phase2 output
-            return json.dumps(
-                {
-                    "sections": {
-                        "overview": {"bullets": []},
-                        "key_changes": [],
-                        "recommendations": [],
-                        "resume_bullets": [],
-                        "linkedin": {"sentences": []},
-                        "highlights": [],
-                        "timeline": [],
-                        "tech_inventory": {},
-                    }
-                }
-            ), {"prompt_tokens": 10}
-
-        monkeypatch.setattr("subprocess.run", mock_subprocess_run)
-        monkeypatch.setattr("run_pipeline.claude_call", mock_claude_call)
-
-        result = run(foreground=True)
-
-        # Pipeline completes (may return 0 or 1 depending on implementation)
-        # Key is it doesn't crash
-        assert (tmp_path / "output" / "dev-activity-report.md").exists()
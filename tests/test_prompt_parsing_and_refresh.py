@@ -3,7 +3,7 @@ Parser hardening and thorough refresh utility tests.
 """
 
 import json
-from pathlib import Path
+import os
 
 import pytest
 
@@ -32,12 +32,221 @@ class TestPhase2JsonParsing:
         parsed = parse_llm_json_output(raw)
         assert "sections" in parsed
 
+    def test_parse_fenced_json_with_crlf_and_unclosed_fence(self):
+        from run_pipeline import parse_llm_json_output
+
+        body = '{"sections":{"overview":{"bullets":["ok"]}}}'
+        assert parse_llm_json_output("```json\r\n" + body + "\r\n```")["sections"]
+        assert parse_llm_json_output("```\n" + body)["sections"]
+
+    def test_parse_fenced_block_inside_prose(self):
+        from run_pipeline import parse_llm_json_output
+
+        body = '{"sections":{"overview":{"bullets":["run ```make``` first"]}}}'
+        raw = "Here you go:\n```json\n" + body + "\n```\nLet me know if you need changes."
+        assert parse_llm_json_output(raw)["sections"]["overview"]["bullets"] == ["run ```make``` first"]
+        assert parse_llm_json_output(body)["sections"]  # backticks in a value, no fence
+
+    def test_scanner_skips_stray_braces_and_quotes_in_prose(self):
+        from run_pipeline import _scan_json_object, parse_llm_json_output
+
+        raw = 'Use the {sections} key, "as asked:\n{"sections": {"overview": {"bullets": ["a}{\\"b"]}}}'
+        assert parse_llm_json_output(raw)["sections"]["overview"]["bullets"] == ['a}{"b']
+        assert _scan_json_object('{"a": "x\\\\"}') == 0
+        assert _scan_json_object('{"a": 1} trailing') == -1
+        assert _scan_json_object('text {"a": {"b": 1}') == -1
+        assert _scan_json_object('[{"a": 1}, {"b": 2}') == -1
+
+    def test_scanner_ignores_unclosed_brace_in_prose(self):
+        from run_pipeline import _scan_json_object, parse_llm_json_output
+
+        raw = 'Note: use a { for blocks. Result: {"a": 1}'
+        assert _scan_json_object(raw) == raw.index('{"a"')
+        assert parse_llm_json_output(raw) == {"a": 1}
+
     def test_rejects_top_level_array(self):
         from run_pipeline import parse_llm_json_output
 
         with pytest.raises(json.JSONDecodeError):
             parse_llm_json_output('[{"not":"an object"}]')
 
+    def test_split_phase2_output_shapes(self):
+        from run_pipeline import split_phase2_output
+
+        assert split_phase2_output({"sections": {"overview": {}}, "render_hints": {"x": 1}}) == (
+            {"overview": {}},
+            {"x": 1},
+        )
+        assert split_phase2_output({"sections": None}) == ({}, {})
+        assert split_phase2_output({"timeline": []}) == ({"timeline": []}, {})
+        assert split_phase2_output({"summary": "no sections"}) is None
+
+    def test_phase2_shape_errors_flags_mistyped_sections(self):
+        from run_pipeline import phase2_shape_errors
+
+        from .fixtures import valid_phase2_output
+
+        assert phase2_shape_errors(valid_phase2_output()["sections"]) == []
+        assert phase2_shape_errors({"key_changes": None, "timeline": []}) == []
+        assert phase2_shape_errors({"key_changes": "text", "overview": ["x"]}) == [
+            "overview: expected object, got list",
+            "key_changes: expected array, got str",
+        ]
+        assert phase2_shape_errors([]) == ["sections: expected object, got list"]
+
+    def test_normalize_label_expands_compact_keys(self):
+        from run_pipeline import normalize_label
+
+        assert normalize_label("mk") == "Ownership markers"
+        assert normalize_label("MK: 3 markers") == "Ownership markers: 3 markers"
+        assert normalize_label("**St** active") == "Project status active"
+        assert normalize_label("stats - 4 cached") == "Stats - 4 cached"
+        assert normalize_label("stale projects") == "stale projects"
+        assert normalize_label("mK: odd casing") == "mK: odd casing"
+
+    def test_normalize_sections_rewrites_key_changes_in_place(self):
+        from run_pipeline import normalize_sections
+
+        bullets = ["mk", 3]
+        sections = {"key_changes": [{"title": "st", "bullets": bullets}, "stray"]}
+        assert normalize_sections(sections) is sections
+        assert sections["key_changes"][0]["title"] == "Project status"
+        assert sections["key_changes"][0]["bullets"] is bullets
+        assert bullets == ["Ownership markers", 3]
+
+    def test_expand_compact_payload_keys_and_defaults(self):
+        from run_pipeline import expand_compact_payload
+
+        expanded = expand_compact_payload(
+            {
+                "p": [{"n": "demo", "pt": "/a/demo", "cc": "3", "fc": None, "rt": "/a"}, {}],
+                "mk": [{"m": "not", "p": "/a/x"}],
+                "x": [{"p": "/e", "exists": 1, "git": 0}],
+            }
+        )
+        demo, empty = expanded["projects"]
+        assert demo["name"] == "demo" and demo["path"] == "/a/demo" and demo["root"] == "/a"
+        assert demo["commit_count"] == 3 and demo["changed_files"] == []
+        assert empty["name"] == "" and empty["status"] == "orig" and empty["commit_count"] == 0
+        assert expanded["ownership_markers"] == [{"marker": "not", "path": "/a/x"}]
+        assert expanded["extra_scan_dirs"][0]["exists"] is True
+        assert expanded["extra_scan_dirs"][0]["is_git"] is False
+
+    def test_expand_compact_payload_drops_malformed_entries(self):
+        from run_pipeline import expand_compact_payload
+
+        expanded = expand_compact_payload(
+            {
+                "p": [None, "demo", {"n": "ok"}],
+                "mk": [None, {"m": "fork", "p": "/a"}],
+                "x": [["/e"], {"p": "/e"}],
+                "ins": ["## Usage", None, 3],
+            }
+        )
+        assert [proj["name"] for proj in expanded["projects"]] == ["ok"]
+        assert len(expanded["ownership_markers"]) == 1
+        assert [item["path"] for item in expanded["extra_scan_dirs"]] == ["/e"]
+        assert expanded["insights"] == ["## Usage"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="relies on POSIX executable bits")
+    def test_cli_lookup_cached_per_path(self, tmp_path, monkeypatch):
+        import run_pipeline
+
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        fake = bin_dir / "claude"
+        fake.write_text("#!/bin/sh\n")
+        fake.chmod(0o755)
+
+        monkeypatch.setenv("PATH", str(bin_dir))
+        assert run_pipeline.find_claude_bin() == str(fake)
+        fake.unlink()
+        assert run_pipeline.find_claude_bin() == str(fake)  # cached for this PATH
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert run_pipeline.find_claude_bin() is None
+
+    def test_load_env_parses_quotes_and_reloads_on_change(self, tmp_path, monkeypatch):
+        import sys
+        import run_pipeline
+
+        monkeypatch.setitem(sys.modules, "dotenv", None)  # exercise the built-in parser
+        env_file = tmp_path / ".env"
+        env_file.write_text('# c\nAPPS_DIR=~/p\nRESUME_HEADER="Acme, Jan – Now"\nQ=\'a=b\'\nBAD\nE=\n')
+        monkeypatch.setattr(run_pipeline, "ENV_FILE", env_file)
+
+        env = run_pipeline.load_env()
+        assert env == {"APPS_DIR": "~/p", "RESUME_HEADER": "Acme, Jan – Now", "Q": "a=b", "E": ""}
+        env["USE_CODEX"] = "true"  # callers mutate their copy
+        assert "USE_CODEX" not in run_pipeline.load_env()
+
+        env_file.write_text("APPS_DIR=~/changed\n")
+        assert run_pipeline.load_env() == {"APPS_DIR": "~/changed"}
+        env_file.unlink()
+        assert run_pipeline.load_env() == {}
+
+    def test_env_bool_shares_one_truthiness_rule(self):
+        import run_pipeline
+
+        import phase1_5_draft
+
+        env = {"A": " Yes ", "B": "on", "C": "TRUE", "D": "0", "E": "false", "F": "", "G": "y", "H": "T"}
+        keys = "ABCDEGH"
+        # Only USE_CODEX / PHASE15_THOROUGH (truthy=_TRUTHY_FLAGS) take the single letters.
+        expected = [True, True, True, False, False, True, True]
+        flags = run_pipeline._TRUTHY_FLAGS
+        assert [run_pipeline.env_bool(env, k, truthy=flags) for k in keys] == expected
+        assert [phase1_5_draft._truthy(env[k]) for k in keys] == expected
+        assert [run_pipeline.env_bool(env, k) for k in keys] == expected[:5] + [False, False]
+        assert run_pipeline.env_bool(env, "F", default=True) is True
+        assert run_pipeline.env_bool(env, "MISSING") is False
+        assert phase1_5_draft._truthy(None) is False and phase1_5_draft._truthy("") is False
+
+    def test_last_json_line_and_loads_json(self, monkeypatch):
+        import run_pipeline
+
+        stdout = 'Scanning\n{"fp": "old"}\r\n  {"fp": "new", "n": "caf\u00e9"}  \nwarn: slow disk\n\n'
+        line = run_pipeline.last_json_line(stdout)
+        assert line == '{"fp": "new", "n": "caf\u00e9"}'
+        assert run_pipeline.last_json_line("no json here\n") == ""
+        assert run_pipeline.last_json_line("") == ""
+
+        fast = [run_pipeline.loads_json(text) for text in (line, '{"fp": "ascii"}')]
+        monkeypatch.setattr(run_pipeline, "orjson", None)
+        assert fast == [run_pipeline.loads_json(text) for text in (line, '{"fp": "ascii"}')]
+
+    def test_compact_dumps_match_stdlib_bytes(self, monkeypatch):
+        import phase1_5_draft
+        import run_pipeline
+
+        objs = [
+            {"p": [{"n": "demo", "cc": 3, "fk": False, "x": None}], "r": 0.5},
+            {"n": "caf\u00e9 \u2013 \U0001F600"},  # non-ASCII stays \\u-escaped
+            {1: "int keys", "s": "tab\t\"q\""},  # orjson rejects non-str keys
+            {"a": 1e16, "b": [1e-7, 1.5e300]},  # orjson: 1e16 / 1e-7 / 1.5e300
+            {"n": [float("nan"), float("inf"), -float("inf")]},  # orjson: null
+        ]
+        expected = [json.dumps(obj, separators=(",", ":")) for obj in objs]
+        assert expected[3] == '{"a":1e+16,"b":[1e-07,1.5e+300]}'
+        assert phase1_5_draft.dumps_compact is run_pipeline.dumps_compact
+        assert [run_pipeline.dumps_compact(obj) for obj in objs] == expected
+        monkeypatch.setattr(run_pipeline, "orjson", None)
+        assert [run_pipeline.dumps_compact(obj) for obj in objs] == expected
+
+    def test_native_and_stdlib_parsers_agree(self, monkeypatch):
+        import run_pipeline
+
+        raws = [
+            "```json\n{\"a\": [1, 2.5, \"\\u00e9\"]}\n```",
+            "Prefix text\n{\"n\": -42, \"ok\": true, \"none\": null}",
+            '{"x": NaN}',
+        ]
+        fast = [run_pipeline.parse_llm_json_output(raw) for raw in raws]
+        monkeypatch.setattr(run_pipeline, "orjson", None)
+        slow = [run_pipeline.parse_llm_json_output(raw) for raw in raws]
+        assert repr(fast) == repr(slow)
+        with pytest.raises(json.JSONDecodeError):
+            run_pipeline.parse_llm_json_output('{"a": 1} trailing')
+
     def test_phase15_prompt_injects_summary_after_custom_rules(self):
         from phase1_5_draft import build_prompt
 
@@ -49,60 +258,24 @@ class TestPhase2JsonParsing:
             "Additional user rules from .env"
         )
 
-    def test_phase2_uses_rules_extra_without_schema_loss(self, monkeypatch):
+    def test_phase2_uses_rules_extra_without_schema_loss(self, patched_calls):
         import run_pipeline
 
-        captured = {}
-
-        def fake_claude_call(prompt, model, claude_bin, system_prompt=None, timeout=300):
-            captured["prompt"] = prompt
-            return "{}", {"prompt_tokens": 1, "completion_tokens": 1}
-
-        monkeypatch.setattr(run_pipeline, "claude_call", fake_claude_call)
-        monkeypatch.setattr(
-            run_pipeline,
-            "extract_insights_quotes",
-            lambda env, claude_bin=None, codex_bin=None: ("", ""),
-        )
-
         env = {
             "RESUME_HEADER": "Name, Jan 2025 - Present",
             "PHASE2_MODEL": "sonnet",
             "PHASE2_RULES_EXTRA": "Use exactly 7 resume bullets.",
         }
         run_pipeline.call_phase2("{}", "- draft", env, "/usr/bin/claude")
-        prompt = captured["prompt"]
+        prompt = patched_calls["claude"][0]
         assert "Use exactly 7 resume bullets." in prompt
         assert '"sections"' in prompt
         assert "Summary JSON (compact):" in prompt
         assert "Draft bullets:" in prompt
 
-    def test_phase2_routes_to_codex_for_openai_model_when_use_codex_true(self, monkeypatch):
+    def test_phase2_routes_to_codex_for_openai_model_when_use_codex_true(self, patched_calls):
         import run_pipeline
 
-        called = {"codex": 0, "claude": 0}
-
-        def fake_codex(prompt, model, codex_bin, env=None, sandbox="workspace-write", system_prompt=None, timeout=300):
-            called["codex"] += 1
-            return "{}", {"prompt_tokens": 0, "completion_tokens": 0}
-
-        def fake_claude(prompt, model, claude_bin, system_prompt=None, timeout=300, max_tokens=2048):
-            called["claude"] += 1
-            return "{}", {"prompt_tokens": 1, "completion_tokens": 1}
-
-        monkeypatch.setattr(run_pipeline, "codex_exec_call", fake_codex)
-        monkeypatch.setattr(run_pipeline, "claude_call", fake_claude)
-        monkeypatch.setattr(
-            run_pipeline,
-            "extract_insights_quotes",
-            lambda env, claude_bin=None, codex_bin=None: ("", ""),
-        )
-        monkeypatch.setattr(
-            run_pipeline,
-            "extract_insights_quote_entries",
-            lambda env, claude_bin=None, codex_bin=None: ([], ""),
-        )
-
         env = {
             "USE_CODEX": "true",
             "PHASE2_MODEL": "gpt-5.1-codex-mini",
@@ -114,8 +287,8 @@ class TestPhase2JsonParsing:
             claude_bin="/usr/bin/claude",
             codex_bin="/usr/bin/codex",
         )
-        assert called["codex"] == 1
-        assert called["claude"] == 0
+        assert len(patched_calls["codex"]) == 1
+        assert patched_calls["claude"] == []
 
     def test_extract_insights_quotes_opt_in(self, tmp_path):
         import run_pipeline
@@ -167,6 +340,39 @@ class TestPhase2JsonParsing:
         assert entries[0]["source_link"].startswith("file://")
         assert source == str(html_file)
 
+    def test_insights_quotes_extracted_once_per_report_state(self, tmp_path, monkeypatch):
+        import run_pipeline
+
+        html_file = tmp_path / "report.html"
+        html_file.write_text("<p>Workflow outcomes improved after automation cleanup.</p>", encoding="utf-8")
+        env = {
+            "INCLUDE_CLAUDE_INSIGHTS_QUOTES": "true",
+            "INSIGHTS_REPORT_PATH": str(html_file),
+            "PHASE2_MODEL": "sonnet",
+        }
+        prompts = []
+
+        def fake_model_call(prompt, model, env, claude_bin=None, codex_bin=None, system_prompt=None, timeout=300):
+            prompts.append(prompt)
+            if system_prompt == "Return JSON only.":
+                return '{"quotes":["Workflow outcomes improved after automation cleanup."]}', {}
+            return "{}", {}
+
+        monkeypatch.setattr(run_pipeline, "call_model", fake_model_call)
+        run_pipeline.call_phase2("{}", "- draft", env, "/usr/bin/claude")
+        assert len(prompts) == 2  # one quote selection + the Phase 2 call
+        assert '- "Workflow outcomes improved after automation cleanup."' in prompts[1]
+        assert '"quote":"Workflow outcomes improved after automation cleanup."' in prompts[1]
+
+        entries, _ = run_pipeline.extract_insights_quote_entries(env, claude_bin="/usr/bin/claude")
+        entries[0]["quote"] = "mutated by caller"
+        again, _ = run_pipeline.extract_insights_quote_entries(env, claude_bin="/usr/bin/claude")
+        assert len(prompts) == 2 and again[0]["quote"].startswith("Workflow outcomes")
+
+        html_file.write_text("<p>Workflow outcomes improved again after the rewrite.</p>", encoding="utf-8")
+        run_pipeline.extract_insights_quote_entries(env, claude_bin="/usr/bin/claude")
+        assert len(prompts) == 3
+
     def test_extract_insights_quotes_no_heuristic_fallback_by_default(self, tmp_path):
         import run_pipeline
 
@@ -183,6 +389,27 @@ class TestPhase2JsonParsing:
         assert entries == []
         assert source == str(html_file)
 
+    def test_heuristic_fallback_dedupes_and_stops_at_max_quotes(self, tmp_path):
+        import run_pipeline
+
+        html_file = tmp_path / "report.html"
+        html_file.write_text(
+            "<p>Automation sped up the release workflow.</p>" * 3
+            + "<p>.css-rule</p><p>Session count doubled this month.</p><p>Tool usage grew.</p>",
+            encoding="utf-8",
+        )
+        env = {
+            "INCLUDE_CLAUDE_INSIGHTS_QUOTES": "true",
+            "INSIGHTS_REPORT_PATH": str(html_file),
+            "INSIGHTS_QUOTES_ALLOW_HEURISTIC_FALLBACK": "true",
+            "CLAUDE_INSIGHTS_QUOTES_MAX": "2",
+        }
+        entries, _ = run_pipeline.extract_insights_quote_entries(env)
+        assert [e["quote"] for e in entries] == [
+            "Automation sped up the release workflow.",
+            "Session count doubled this month.",
+        ]
+
     def test_parse_insights_sections(self):
         import run_pipeline
 
@@ -240,69 +467,47 @@ class TestPhase15ThoroughMode:
                 + __import__("json").dumps(self.SUMMARY, separators=(",", ":"))
             )
 
-    def test_run_pipeline_terse_prompt(self):
-        from run_pipeline import PHASE15_TERSE_TMPL, call_phase15_claude
+    def test_prompt_header_reused_across_summaries(self):
+        from phase1_5_draft import _prompt_header, build_prompt
 
-        captured = {}
+        env = {"PHASE15_THOROUGH": "yes", "PHASE15_RULES_EXTRA": "  Name repos.  "}
+        _prompt_header.cache_clear()
+        first = build_prompt(self.SUMMARY, env)
+        second = build_prompt({"p": []}, env)
+        header = _prompt_header(True, "Name repos.")
+        assert first.startswith(header) and second == header + '{"p":[]}'
+        assert _prompt_header.cache_info().misses == 1
 
-        import run_pipeline
-        original = run_pipeline.claude_call
-
-        def fake_call(prompt, model, claude_bin, system_prompt=None, timeout=180):
-            captured["prompt"] = prompt
-            return "- bullet", {}
+    def test_run_pipeline_terse_prompt(self, patched_calls):
+        from run_pipeline import PHASE15_TERSE_TMPL, call_phase15_claude
 
-        import unittest.mock as mock
-        with mock.patch.object(run_pipeline, "claude_call", fake_call):
-            call_phase15_claude(self.SUMMARY, {}, "/usr/bin/claude")
+        call_phase15_claude(self.SUMMARY, {}, "/usr/bin/claude")
 
-        assert PHASE15_TERSE_TMPL in captured["prompt"]
-        assert "lowlight" not in captured["prompt"].lower()
+        prompt = patched_calls["claude"][0]
+        assert PHASE15_TERSE_TMPL in prompt
+        assert "lowlight" not in prompt.lower()
 
-    def test_run_pipeline_phase15_routes_to_codex_for_openai_model_when_use_codex_true(self):
+    def test_run_pipeline_phase15_routes_to_codex_for_openai_model_when_use_codex_true(self, patched_calls):
         import run_pipeline
-        import unittest.mock as mock
-
-        called = {"codex": 0, "claude": 0}
-
-        def fake_codex(prompt, model, codex_bin, env=None, sandbox="workspace-write", system_prompt=None, timeout=300):
-            called["codex"] += 1
-            return "- bullet", {"prompt_tokens": 0, "completion_tokens": 0}
 
-        def fake_claude(prompt, model, claude_bin, system_prompt=None, timeout=300, max_tokens=2048):
-            called["claude"] += 1
-            return "- bullet", {"prompt_tokens": 1, "completion_tokens": 1}
-
-        with mock.patch.object(run_pipeline, "codex_exec_call", fake_codex):
-            with mock.patch.object(run_pipeline, "claude_call", fake_claude):
-                run_pipeline.call_phase15_claude(
-                    self.SUMMARY,
-                    {"USE_CODEX": "true", "PHASE15_MODEL": "gpt-5.1-codex-mini"},
-                    claude_bin="/usr/bin/claude",
-                    codex_bin="/usr/bin/codex",
-                )
-
-        assert called["codex"] == 1
-        assert called["claude"] == 0
+        run_pipeline.call_phase15_claude(
+            self.SUMMARY,
+            {"USE_CODEX": "true", "PHASE15_MODEL": "gpt-5.1-codex-mini"},
+            claude_bin="/usr/bin/claude",
+            codex_bin="/usr/bin/codex",
+        )
+        assert len(patched_calls["codex"]) == 1
+        assert patched_calls["claude"] == []
 
-    def test_run_pipeline_thorough_prompt(self):
+    def test_run_pipeline_thorough_prompt(self, patched_calls):
         from run_pipeline import PHASE15_THOROUGH_TMPL, call_phase15_claude
 
-        captured = {}
-
-        import run_pipeline
-        import unittest.mock as mock
+        call_phase15_claude(self.SUMMARY, {"PHASE15_THOROUGH": "true"}, "/usr/bin/claude")
 
-        def fake_call(prompt, model, claude_bin, system_prompt=None, timeout=180):
-            captured["prompt"] = prompt
-            return "- bullet", {}
-
-        with mock.patch.object(run_pipeline, "claude_call", fake_call):
-            call_phase15_claude(self.SUMMARY, {"PHASE15_THOROUGH": "true"}, "/usr/bin/claude")
-
-        assert PHASE15_THOROUGH_TMPL in captured["prompt"]
-        assert "lowlight" in captured["prompt"].lower()
-        assert "watch-out" in captured["prompt"].lower()
+        prompt = patched_calls["claude"][0]
+        assert PHASE15_THOROUGH_TMPL in prompt
+        assert "lowlight" in prompt.lower()
+        assert "watch-out" in prompt.lower()
 
 
 class TestThoroughRefresh:
@@ -317,6 +522,14 @@ class TestThoroughRefresh:
         assert str(roots[0]).endswith("/apps-a")
         assert str(roots[1]).endswith("/apps-b")
 
+    def test_resolve_roots_splits_commas_and_dedupes(self, tmp_path):
+        from thorough_refresh import resolve_roots
+
+        a, b = tmp_path / "a", tmp_path / "b"
+        assert resolve_roots({"APPS_DIRS": f"{a},{b}  {a}/"}, cli_roots=[]) == [a, b]
+        assert resolve_roots({"APPS_DIRS": f" {a} "}, cli_roots=[]) == [a]
+        assert resolve_roots({"APPS_DIRS": " , ", "APPS_DIR": str(b)}, cli_roots=[]) == [b]
+
     def test_collect_skill_cache_targets(self, tmp_path):
         from thorough_refresh import Plan, collect_skill_cache_targets
 
@@ -333,6 +546,41 @@ class TestThoroughRefresh:
         assert ".phase1-cache.json" in targets
         assert ".phase1-cache.tmp" in targets
         assert ".dev-report-cache.md" in targets
+        assert plan.stats["cache_files"] == 3
+
+    def test_collect_skill_cache_targets_missing_skill_dir(self, tmp_path):
+        from thorough_refresh import Plan, collect_skill_cache_targets
+
+        plan = Plan()
+        collect_skill_cache_targets(plan, tmp_path / "not-installed")
+        assert plan.delete_files == set() and plan.stats["cache_files"] == 0
+
+    def test_sync_excludes_cover_skill_caches(self):
+        """Every cache thorough_refresh deletes is also kept out of skill sync and its diff."""
+        from pathlib import Path
+
+        import setup_env
+        from thorough_refresh import SKILL_CACHE_NAMES
+
+        assert SKILL_CACHE_NAMES <= setup_env.SYNC_SKIP_FILES
+        sync_sh = (Path(setup_env.__file__).parent / "sync_skill.sh").read_text(encoding="utf-8")
+        for name in SKILL_CACHE_NAMES:
+            assert sync_sh.count(f'--exclude="{name}"') == 2, name
+
+    def test_collect_root_cache_targets_only_existing_project_caches(self, tmp_path):
+        from thorough_refresh import Plan, collect_root_cache_targets
+
+        root = tmp_path / "apps"
+        (root / "cached").mkdir(parents=True)
+        (root / "cached" / ".dev-report-cache.md").write_text("x")
+        (root / "fresh").mkdir()
+        (root / ".dev-report-cache.md").write_text("root-level file, not a project")
+
+        plan = Plan()
+        collect_root_cache_targets(plan, root)
+        collect_root_cache_targets(plan, tmp_path / "missing")
+        assert plan.delete_files == {root / "cached" / ".dev-report-cache.md"}
+        assert plan.stats["cache_files"] == 1
 
     def test_collect_marker_actions_promotes_fork_and_clears_not_my_work(self, tmp_path):
         from thorough_refresh import Plan, collect_marker_actions
@@ -355,17 +603,62 @@ class TestThoroughRefresh:
         assert (project / ".forked-work-modified") in plan.touch_files
         assert (project / ".not-my-work") in plan.delete_files
 
+    def test_collect_marker_actions_merges_roots_in_order(self, tmp_path):
+        from thorough_refresh import Plan, collect_marker_actions
+
+        roots = [tmp_path / "a", tmp_path / "b"]
+        for root in roots:
+            (root / "proj").mkdir(parents=True)
+            (root / "proj" / ".forked-work").touch()
+            (root / "proj" / ".skip-for-now").touch()
+
+        plan = Plan()
+        collect_marker_actions(
+            plan=plan,
+            roots=roots + [roots[0]],  # a repeated root must not double count
+            clear_skip=True,
+            clear_not_my_work_all=False,
+            clear_not_my_work_forked=True,
+        )
+
+        assert plan.touch_files == {root / "proj" / ".forked-work-modified" for root in roots}
+        assert plan.delete_files == {root / "proj" / ".skip-for-now" for root in roots}
+        assert plan.stats["promote_forked"] == 2 and plan.stats["clear_skip"] == 2
+
+    def test_root_marker_actions_ignores_files_and_missing_roots(self, tmp_path):
+        from thorough_refresh import root_marker_actions
+
+        (tmp_path / ".forked-work").touch()  # a marker at root level is not a project
+        (tmp_path / "notes.txt").touch()
+        (tmp_path / "proj").mkdir()
+        (tmp_path / "proj" / ".not-my-work").touch()
+
+        flags = dict(clear_skip=True, clear_not_my_work_all=True, clear_not_my_work_forked=True)
+        assert root_marker_actions(tmp_path, **flags) == [
+            ("delete", tmp_path / "proj" / ".not-my-work", "clear_not_my_work_all")
+        ]
+        assert root_marker_actions(tmp_path / "missing", **flags) == []
+
 
 class TestRunReportContracts:
     """Regression checks for run_report.sh runtime contract."""
 
-    def test_setup_env_uses_supported_flags(self):
-        script = Path("skills/dev-activity-report-skill/scripts/run_report.sh").read_text(encoding="utf-8")
-        assert "--non-interactive" not in script
-        assert 'python3 "$SKILL_DIR/scripts/setup_env.py"' in script
-
-    def test_codex_phase25_merges_insights_metadata(self):
-        script = Path("skills/dev-activity-report-skill/scripts/run_report.sh").read_text(encoding="utf-8")
-        assert "parse_insights_sections" in script
-        assert "extract_insights_quote_entries" in script
-        assert '"insights": {' in script
+    def test_setup_env_uses_supported_flags(self, run_report_sh):
+        assert "--non-interactive" not in run_report_sh
+        assert 'python3 "$SKILL_DIR/scripts/setup_env.py"' in run_report_sh
+
+    def test_codex_phase25_merges_insights_metadata(self, run_report_sh):
+        assert "parse_insights_sections" in run_report_sh
+        assert "extract_insights_quote_entries" in run_report_sh
+        assert '"insights": {' in run_report_sh
+
+    def test_interactive_review_copies_only_sections(self):
+        from review_report import run_interactive_review
+
+        payload = {"p": [{"n": "big"}]}
+        report = {"sections": {"overview": {"bullets": ["a"]}}, "source_payload": payload}
+        updated, changed = run_interactive_review(report, input_fn=lambda _: "q", output_fn=lambda *_: None)
+        assert updated["source_payload"] is payload
+        assert updated["sections"] is not report["sections"]
+        assert report["sections"] == {"overview": {"bullets": ["a"]}}
+        assert not changed
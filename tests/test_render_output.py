@@ -0,0 +1,326 @@
+"""
+render_report.py rendering and command-line tests.
+
+Renderers are imported once at module scope; the CLI is driven in-process
+through a shared `run_cli` fixture instead of spawning the script.
+"""
+
+import io
+import json
+import sys
+
+import pytest
+
+import render_report
+from render_report import HTML_CSS, main, render_html, render_markdown
+
+from .fixtures import valid_phase2_output
+
+
+@pytest.fixture(scope="module")
+def full_report():
+    """Every section populated, plus inline insights; built once per module.
+    Renderers only read the report, so tests share the one dict."""
+    return valid_phase2_output(
+        generated_at="2024-01-15T10:00:00Z",
+        resume_header="Senior Engineer",
+        insights={
+            "source": {"log_link": "file:///tmp/insights-log.md"},
+            "quotes": [{"quote": "Automation improved workflow outcomes.", "source_link": "file:///tmp/report.html"}],
+            "sections": [{"title": "Wins", "content": ["Reduced manual steps by 40%"]}],
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def empty_report():
+    """No sections at all; built once per module."""
+    return {"generated_at": "2024-01-15T10:00:00Z", "sections": {}}
+
+
+@pytest.fixture(scope="module")
+def work(tmp_path_factory):
+    """One scratch directory for the whole module (a single mkdtemp)."""
+    return tmp_path_factory.mktemp("render")
+
+
+@pytest.fixture
+def workdir(work, request):
+    """Per-test subdirectory of the module scratch directory."""
+    path = work / request.node.name
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def report_json(workdir, full_report):
+    """The full report as a Phase 2 JSON file under workdir."""
+    path = workdir / "report.json"
+    path.write_text(json.dumps(full_report), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def report_stdin(monkeypatch, full_report):
+    """The full report served on sys.stdin for `--input -`."""
+    monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps(full_report)))
+
+
+@pytest.fixture
+def run_cli(monkeypatch):
+    """Run render_report.main() with the given arguments as sys.argv."""
+    def _run(*args):
+        monkeypatch.setattr(sys, "argv", ["render_report.py", *map(str, args)])
+        main()
+    return _run
+
+
+class TestMarkdownRendering:
+    """render_markdown output shape."""
+
+    def test_basic_markdown_render(self, full_report):
+        """Every populated section renders its content."""
+        md = render_markdown(full_report)
+
+        assert md.startswith("# Dev Activity Report\n**Senior Engineer**\n*Generated: 2024-01-15T10:00:00Z*\n")
+        assert "## Overview\n\n- Shipped feature X\n" in md
+        assert "### Feature X\n\n- Implemented core functionality\n" in md
+        assert "- Refactor module A `MEDIUM`\n" in md
+        assert "## Resume Bullets\n\n- Led development of feature X\n" in md
+        assert "> Excited to share my recent work on feature X." in md
+        assert "- **Performance Improvement** — Reduced P99 latency by 50%\n" in md
+        assert '"Automation improved workflow outcomes." (file:///tmp/report.html)' in md
+        assert "| 2024-01-15 | Launched feature X |" in md
+        assert "| Languages | Python, TypeScript |" in md
+        assert "(none)" not in md
+
+    def test_empty_sections_handled(self, empty_report):
+        """Every section renders in order, with the "(none)" placeholder when empty."""
+        md = render_markdown(empty_report)
+
+        blocks = md.rstrip("\n").split("\n\n---\n\n")
+        assert blocks[0] == "# Dev Activity Report\n*Generated: 2024-01-15T10:00:00Z*"
+        assert [b.split("\n", 1)[0] for b in blocks[1:]] == [
+            "## Overview", "## Key Changes", "## Recommendations", "## Resume Bullets",
+            "## LinkedIn", "## Highlights", "## Timeline", "## Tech Inventory",
+        ]
+        assert md.count("- (none)") == 7
+        assert "## LinkedIn\n\n(none)" in md
+        assert md.endswith("- (none)\n")
+
+    def test_malformed_bullets_handled(self):
+        """Null entries are skipped and non-string entries stringified in both formats."""
+        report = {
+            "generated_at": "2024-01-15T10:00:00Z",
+            "sections": {
+                "overview": {"bullets": ["Valid bullet", None, 123, "Another valid"]},
+                "key_changes": [{"title": "Only nulls", "bullets": [None]}],
+                "resume_bullets": [],
+                "tech_inventory": {"languages": ["Python", None, 3]},
+            },
+        }
+
+        md = render_markdown(report)
+        assert "## Overview\n\n- Valid bullet\n- 123\n- Another valid\n" in md
+        assert "## Key Changes\n\n### Only nulls\n" in md
+        assert "| Languages | Python, 3 |" in md
+        assert "None" not in md
+
+        page = render_html(report)
+        assert "<ul><li>Valid bullet</li><li>123</li><li>Another valid</li></ul>" in page
+        assert "<h3>Only nulls</h3><p>(none)</p>" in page
+        assert "<td>Python, 3</td>" in page
+        assert "None" not in page
+
+    def test_priority_badges_rendered(self):
+        """High/medium priorities get a badge in both formats; others (even non-strings) render bare."""
+        report = {
+            "generated_at": "2024-01-15T10:00:00Z",
+            "sections": {
+                "recommendations": [
+                    {"text": "Refactor module A ", "priority": "high"},
+                    {"text": "Add docs", "priority": "medium"},
+                    {"text": "Tidy imports", "priority": "low"},
+                    {"text": "No priority"},
+                    {"text": "List priority", "priority": ["high"]},
+                    {"text": "Dict priority", "priority": {"level": "high"}},
+                ],
+            },
+        }
+
+        md = render_markdown(report)
+        assert (
+            "- Refactor module A `HIGH`\n- Add docs `MEDIUM`\n- Tidy imports\n- No priority\n"
+            "- List priority\n- Dict priority\n"
+        ) in md
+
+        page = render_html(report)
+        assert '<li>Refactor module A <span class="priority-high">high</span></li>' in page
+        assert '<li>Add docs<span class="priority-medium">medium</span></li>' in page
+        assert (
+            "<li>Tidy imports</li><li>No priority</li><li>List priority</li><li>Dict priority</li>"
+        ) in page
+
+    def test_tech_inventory_fixed_row_order(self):
+        """Tech rows follow the fixed category order, skipping empty and unknown keys."""
+        report = {"sections": {"tech_inventory": {
+            "infra": ["Docker"], "extra": ["ignored"], "ai_tools": [], "languages": ["Python", "Go"],
+        }}}
+
+        md = render_markdown(report)
+        assert md.endswith(
+            "## Tech Inventory\n\n| Category | Items |\n|:---|:---|\n"
+            "| Languages | Python, Go |\n| Infra / Tooling | Docker |\n"
+        )
+        page = render_html(report)
+        assert "<tbody><tr><td>Languages</td><td>Python, Go</td></tr><tr><td>Infra / Tooling</td><td>Docker</td></tr></tbody>" in page
+
+
+class TestHtmlRendering:
+    """render_html output shape."""
+
+    def test_special_characters_escaped(self):
+        """Report text is HTML-escaped in HTML and left verbatim in Markdown."""
+        report = {
+            "generated_at": "2024-01-15T10:00:00Z",
+            "resume_header": "R&D <Lead>",
+            "sections": {
+                "overview": {"bullets": ['Use <script>alert("x")</script> & more']},
+                "key_changes": [{"title": "A<B", "bullets": ["x > y"]}],
+                "recommendations": [{"text": "Fix <br> tags", "priority": "high"}],
+                "linkedin": {"sentences": ["Tom & Jerry"]},
+                "highlights": [{"title": "<i>", "rationale": "a&b"}],
+                "timeline": [{"date": "2024-01-15", "event": "<merge>"}],
+                "tech_inventory": {"languages": ["C<T>"]},
+            },
+        }
+
+        page = render_html(report)
+        assert "<script>" not in page
+        assert '<li>Use &lt;script&gt;alert("x")&lt;/script&gt; &amp; more</li>' in page
+        assert '<div class="subhead">R&amp;D &lt;Lead&gt;</div>' in page
+        assert "<h3>A&lt;B</h3><ul><li>x &gt; y</li></ul>" in page
+        assert '<li>Fix &lt;br&gt; tags<span class="priority-high">high</span></li>' in page
+        assert '<blockquote class="linkedin">Tom &amp; Jerry</blockquote>' in page
+        assert "<li><strong>&lt;i&gt;</strong> — a&amp;b</li>" in page
+        assert "<td>&lt;merge&gt;</td>" in page
+        assert "<td>C&lt;T&gt;</td>" in page
+
+        md = render_markdown(report)
+        assert '- Use <script>alert("x")</script> & more' in md
+        assert "**R&D <Lead>**" in md
+
+    def test_basic_html_render(self, full_report):
+        """Every populated section renders its content, Insights included."""
+        page = render_html(full_report)
+
+        assert '<div class="subhead">Senior Engineer</div>' in page
+        assert page.count("<article>") == 9
+        assert "<h3>Feature X</h3><ul><li>Implemented core functionality</li></ul>" in page
+        assert '<blockquote class="linkedin">Excited to share my recent work on feature X.</blockquote>' in page
+        assert "<tr><td>2024-01-15</td><td>Launched feature X</td></tr>" in page
+        assert "<tr><td>Languages</td><td>Python, TypeScript</td></tr>" in page
+        assert "<h4>Wins</h4>" in page
+        assert "(none)" not in page
+
+    def test_html_shell_wraps_sections(self, empty_report):
+        """HTML output carries the static page shell around the section articles."""
+        page = render_html(empty_report)
+
+        assert page.startswith("<!doctype html>\n")
+        assert HTML_CSS in page
+        assert '<p class="meta">Generated: 2024-01-15T10:00:00Z</p>' in page
+        assert page.count("<article>") == 8
+        assert page.endswith("</main>\n</body>\n</html>\n")
+
+
+class TestInsightLinks:
+    """Insights sections that carry only a file:// link."""
+
+    def test_linked_html_strips_script_style_and_breaks_lines(self, workdir):
+        """Linked HTML drops <script>/<style> bodies and turns <br> into line breaks."""
+        page = workdir / "report.html"
+        page.write_text(
+            "<style>p {color: red}</style><p>First &amp; best<br/>Second</p>"
+            "<script>var leaked = 1;</script><li>Third</li>",
+            encoding="utf-8",
+        )
+
+        assert render_report._read_lines_from_file_url(page.as_uri()) == ["First & best", "Second", "Third"]
+
+    def test_linked_html_cleanup_is_case_insensitive_and_bounded(self, workdir):
+        """Multi-line, upper-case and attributed tags are stripped; one <script> doesn't eat the page."""
+        page = workdir / "report.htm"
+        page.write_text(
+            '<SCRIPT type="text/javascript">\nif (a < b) {\n  leak();\n}\n</SCRIPT>'
+            "<div>Kept<BR >after break<br>again</div>"
+            '<Style media="print">\n.x {}\n</Style><h2>Tail</h2>',
+            encoding="utf-8",
+        )
+
+        assert render_report._read_lines_from_file_url(page.as_uri()) == ["Kept", "after break", "again", "Tail"]
+
+    def test_resolve_reads_each_link_once(self, workdir, monkeypatch):
+        """Resolved content feeds both renderers without re-reading; input is untouched."""
+        log = workdir / "log.md"
+        log.write_text("### Wins\n- Shipped it\n### Other\n- skip\n", encoding="utf-8")
+        report = {"sections": {}, "insights": {"sections": [
+            {"title": "Wins", "link": f"{log.as_uri()}#wins"},
+            {"title": "Inline", "content": ["kept"]},
+        ]}}
+        reads = []
+        real_read = render_report._read_lines_from_file_url
+        monkeypatch.setattr(render_report, "_read_lines_from_file_url", lambda link: reads.append(link) or real_read(link))
+
+        resolved = render_report.resolve_insight_links(report)
+        md, page = render_markdown(resolved), render_html(resolved)
+
+        assert len(reads) == 1
+        assert "content" not in report["insights"]["sections"][0]
+        assert "#### Wins\nSource: " in md and "- - Shipped it" in md
+        assert "<li>- Shipped it</li>" in page
+        assert render_report.resolve_insight_links(resolved) is resolved
+
+
+class TestRenderCommandLine:
+    """render_report.py CLI writes the requested formats."""
+
+    @pytest.mark.parametrize(
+        "source, formats, subdir, expected",
+        [
+            ("file", None, "out", {"md"}),
+            ("stdin", " HTML, md,,pdf", "out", {"md", "html"}),
+            ("stdin", "html", "a/b/c", {"html"}),
+        ],
+        ids=["md-default-from-file", "both-formats-from-stdin", "nested-output-dir"],
+    )
+    def test_render_main_writes_formats(self, request, run_cli, workdir, source, formats, subdir, expected):
+        """main() writes exactly the requested formats (unknown or blank entries
+        ignored), creating missing output directories, from a file or stdin."""
+        if source == "file":
+            report_input = request.getfixturevalue("report_json")
+        else:
+            request.getfixturevalue("report_stdin")
+            report_input = "-"
+        out = workdir / subdir
+        args = ["--input", report_input, "--output-dir", out, "--base-name", "report"]
+        run_cli(*args, *(["--formats", formats] if formats else []))
+
+        assert {p.suffix[1:] for p in out.iterdir()} == expected
+        if "md" in expected:
+            assert "- Refactor module A `MEDIUM`" in (out / "report.md").read_text(encoding="utf-8")
+        if "html" in expected:
+            assert (out / "report.html").read_text(encoding="utf-8").startswith("<!doctype html>")
+
+    def test_report_loader_matches_stdlib(self, monkeypatch):
+        """orjson and stdlib parse Phase 2 JSON bytes/str identically, NaN included."""
+        raws = [
+            '{"sections": {"overview": {"bullets": ["caf\u00e9 \u2013 \u2713"]}}}'.encode("utf-8"),
+            '{"generated_at": "2024-01-15", "n": [1, 2.5, null]}',
+            b'{"x": NaN}',
+        ]
+        fast = [render_report._load_report(raw) for raw in raws]
+        monkeypatch.setattr(render_report, "orjson", None)
+        assert repr(fast) == repr([render_report._load_report(raw) for raw in raws])
+        with pytest.raises(json.JSONDecodeError):
+            render_report._load_report(b'{"a": 1} trailing')